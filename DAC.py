@@ -1,45 +1,89 @@
 import math
 
-# ---------- constants ----------
-CONST = 1_860_320
-LOG10_CONST = math.log10(CONST) + 144 * math.log10(3)
-LOG10_PI = math.log10(math.pi)
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:          # numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+# ---------- constants (shared prelude) ----------
+from _core import CONST, LOG10_CONST, LOG10_PI, _M6, leading_digits_from_log10
 
 # ---------- helpers ----------
-def leading_digits_from_log10(log10x, m=6):
-    frac = log10x - math.floor(log10x)
-    return int((10**frac) * 10**(m-1)), frac  # returns (leading_m_digits, mantissa)
+# Deterministic Miller-Rabin witnesses: correct for all n < 3.3e24.
+_MR_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+def _mr_witness(n: int, a: int) -> bool:
+    # Returns True if n passes the Miller-Rabin round for witness a.
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2; s += 1
+    x = pow(a, d, n)
+    if x == 1 or x == n - 1: return True
+    for _ in range(s - 1):
+        x = (x * x) % n
+        if x == n - 1: return True
+    return False
 
 def is_prime(n: int) -> bool:
     if n < 2: return False
-    if n in (2,3): return True
-    if n % 2 == 0: return False
-    r = int(n**0.5)
-    for i in range(3, r+1, 2):
-        if n % i == 0: return False
-    return True
+    for p in _MR_WITNESSES:
+        if n == p: return True
+        if n % p == 0: return False
+    return all(_mr_witness(n, a) for a in _MR_WITNESSES)
+
+# Small primes for cheap trial division ahead of Miller-Rabin.
+_SMALL = (5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61,
+          67, 71, 73, 79, 83, 89, 97, 101, 103, 107, 109, 113, 127, 131,
+          137, 139, 149, 151, 157, 163, 167, 173, 179, 181, 191, 193,
+          197, 199, 211, 223, 227, 229)
 
 def next_prime(n: int) -> int:
     p = max(2, n+1)
-    if p % 2 == 0 and p != 2: p += 1
-    while not is_prime(p):
-        p += 2 if p > 2 else 1
-    return p
+    if p <= 3: return p
+    # Align to the 6k±1 wheel (skips multiples of 2 and 3 for free),
+    # alternating +2/+4 strides like GMP's nextprime addtab.
+    rem = p % 6
+    if rem == 0:   p, add = p + 1, 4
+    elif rem == 1: add = 4
+    elif rem == 5: add = 2
+    else:          p, add = p + (5 - rem), 2
+    while True:
+        if not any(p % q == 0 for q in _SMALL if q * q <= p) and is_prime(p):
+            return p
+        p += add
+        add = 6 - add
 
 def prime_factors(n: int):
-    f, x = set(), n
+    # A list is enough: each d is fully divided out before moving on,
+    # so appends are unique, and iteration avoids set hashing.
+    f, x = [], n
     d = 2
     while d * d <= x:
-        while x % d == 0:
-            f.add(d); x //= d
+        if x % d == 0:
+            f.append(d)
+            while x % d == 0:
+                x //= d
         d = 3 if d == 2 else d + 2
-    if x > 1: f.add(x)
+    if x > 1: f.append(x)
     return f
 
+# Memoized prime factors of p-1; is_primitive_root is called once per
+# candidate a in find_primitive_root, always with the same p.
+_FACT_CACHE = {}
+
 def is_primitive_root(a: int, p: int) -> bool:
     if not is_prime(p): return False
     phi = p - 1
-    for q in prime_factors(phi):
+    qs = _FACT_CACHE.get(p)
+    if qs is None:
+        qs = prime_factors(phi)
+        _FACT_CACHE[p] = qs
+    for q in qs:
         if pow(a, phi // q, p) == 1:
             return False
     return True
@@ -50,6 +94,69 @@ def find_primitive_root(p: int) -> int:
             return a
     raise RuntimeError("No primitive root found (should not happen for prime p).")
 
+# Primitive-root cache across steps, same idea as PINNED_ROOTS in digits.py.
+_PR_CACHE = {}
+
+def _pinned_root(p: int) -> int:
+    r = _PR_CACHE.get(p)
+    if r is None:
+        r = find_primitive_root(p)
+        _PR_CACHE[p] = r
+    return r
+
+# Contiguous trace layout; one row per step, no per-row dict allocation.
+TRACE_DTYPE = np.dtype([
+    ("t", "i4"), ("k", "i8"), ("m", "i8"), ("op", "U3"),
+    ("param", "i8"), ("digits", "i4"), ("leading6", "i8"), ("phi", "f8"),
+])
+
+# ---------- jitted run kernel ----------
+@njit(cache=True)
+def _dac_run_kernel(k0, ms, params, is_mul, mus, shifts, log10_const, log10_pi):
+    # Scalar per-step update loop with the modulus/operator schedule
+    # precomputed; numba compiles this to machine code when available.
+    # Where shifts[t] > 0 the reduction uses the precomputed Barrett
+    # constant mus[t] = floor(2^shift / m) (multiply-shift instead of a
+    # hardware divide); shift 0 falls back to plain %.
+    n = ms.shape[0]
+    ks = np.empty(n, dtype=np.int64)
+    digits = np.empty(n, dtype=np.int64)
+    lead6 = np.empty(n, dtype=np.int64)
+    phis = np.empty(n, dtype=np.float64)
+    k = k0
+    for t in range(n):
+        log10E = log10_const + k * log10_pi
+        fl = math.floor(log10E)
+        frac = log10E - fl
+        digits[t] = int(fl) + 1
+        lead6[t] = int((10.0 ** frac) * 100000.0)
+        phis[t] = frac
+        m = ms[t]
+        if is_mul[t]:
+            if k % m == 0:
+                k = 1
+            x = params[t] * k
+        else:
+            x = k + params[t]
+        ks[t] = k  # after the k%m==0 fixup, matching what step() records
+        sh = shifts[t]
+        if sh > 0:
+            q = (x * mus[t]) >> sh
+            r = x - q * m
+            while r >= m:
+                r -= m
+            k = r
+        else:
+            k = x % m
+        if is_mul[t] and k == 0:
+            k = 1
+    return ks, digits, lead6, phis, k
+
+# Integer enums for the hot-path dispatch; string compares (and boxing,
+# under numba) stay out of the per-step code.
+MODE = {"prime_follow": 0, "prime_ring": 1, "epoch_fixed": 2}
+POLICY = {"parity_switch": 0, "time_switch": 1, "phase_gated": 2}
+
 # ---------- DAC engine ----------
 class DAC:
     def __init__(self,
@@ -78,6 +185,13 @@ class DAC:
         self.add_b = add_b
         self.mul_a = mul_a  # if None, we pick primitive root per step
 
+        if modulus_mode not in MODE:
+            raise ValueError("Unknown modulus_mode")
+        if update_policy not in POLICY:
+            raise ValueError("Unknown update_policy")
+        self._mode = MODE[modulus_mode]
+        self._policy = POLICY[update_policy]
+
         # validate prime sources
         if self.modulus_mode == "prime_ring":
             for p in self.prime_ring:
@@ -88,46 +202,46 @@ class DAC:
                 raise ValueError("epoch_param must be prime for epoch_fixed.")
 
     def choose_modulus(self, t):
-        if self.modulus_mode == "prime_follow":
+        mode = self._mode
+        if mode == 0:    # prime_follow
             return next_prime(self.k + t + self.mu)
-        elif self.modulus_mode == "prime_ring":
+        elif mode == 1:  # prime_ring
             idx = (t + self.rho) % len(self.prime_ring)
             return self.prime_ring[idx]
-        elif self.modulus_mode == "epoch_fixed":
+        else:            # epoch_fixed
             # single-epoch example; extend if you maintain multiple primes by epoch range
             return self.epoch_param
-        else:
-            raise ValueError("Unknown modulus_mode")
 
     def choose_update_operator(self, t, phi, m):
         # returns ("add", b) or ("mul", a)
-        if self.update_policy == "parity_switch":
+        policy = self._policy
+        if policy == 0:    # parity_switch
             if self.k % 2 == 0:
                 return ("add", self.add_b)
             else:
-                a = self.mul_a or find_primitive_root(m)
+                a = self.mul_a or _pinned_root(m)
                 return ("mul", a)
-        elif self.update_policy == "time_switch":
+        elif policy == 1:  # time_switch
             if t % self.tau == 0:
-                a = self.mul_a or find_primitive_root(m)
+                a = self.mul_a or _pinned_root(m)
                 return ("mul", a)
             else:
                 return ("add", self.add_b)
-        elif self.update_policy == "phase_gated":
+        else:              # phase_gated
             lo, hi = self.phase_interval
             if lo <= phi < hi:
-                a = self.mul_a or find_primitive_root(m)
+                a = self.mul_a or _pinned_root(m)
                 return ("mul", a)
             else:
                 return ("add", self.add_b)
-        else:
-            raise ValueError("Unknown update_policy")
 
-    def step(self, t):
-        # Observables before update
+    def _advance(self, t):
+        # Observables before update; floor is shared between digits and phi
         log10E = LOG10_CONST + self.k * LOG10_PI
-        digits = int(math.floor(log10E)) + 1
-        lead6, phi = leading_digits_from_log10(log10E, m=6)
+        fl = math.floor(log10E)
+        digits = int(fl) + 1
+        phi = log10E - fl
+        lead6 = int((10 ** phi) * _M6)
         m = self.choose_modulus(t)
         op, param = self.choose_update_operator(t, phi, m)
 
@@ -141,9 +255,6 @@ class DAC:
             if not is_prime(m):
                 raise ValueError("Multiplicative mode expects prime modulus.")
             a = param
-            if not is_primitive_root(a, m):
-                # Not strictly required, but informs about period potential
-                pass
             if self.k % m == 0:
                 # keep k in 1..m-1 for nice multiplicative cycles
                 self.k = 1
@@ -151,19 +262,89 @@ class DAC:
             if k_next == 0:
                 k_next = 1  # avoid collapsing to 0
 
-        row = {
-            "t": t, "k": self.k, "m": m, "op": op, "param": param,
+        k_now = self.k
+        self.k = k_next
+        return k_now, m, op, param, digits, lead6, phi
+
+    def step(self, t):
+        k, m, op, param, digits, lead6, phi = self._advance(t)
+        return {
+            "t": t, "k": k, "m": m, "op": op, "param": param,
             "digits": digits, "leading6": lead6, "phi": phi
         }
-        self.k = k_next
-        return row
+
+    def step_into(self, trace, t):
+        # Writes one row of a preallocated TRACE_DTYPE array in place.
+        k, m, op, param, digits, lead6, phi = self._advance(t)
+        row = trace[t]
+        row["t"] = t; row["k"] = k; row["m"] = m; row["op"] = op
+        row["param"] = param; row["digits"] = digits
+        row["leading6"] = lead6; row["phi"] = phi
+
+    def _schedule_is_static(self):
+        # The jitted fast path needs the modulus/operator schedule up
+        # front; that only works when neither depends on the evolving k.
+        return (self.modulus_mode in ("prime_ring", "epoch_fixed")
+                and self.update_policy == "time_switch")
 
     def run(self):
-        trace = []
-        for t in range(self.steps):
-            trace.append(self.step(t))
+        trace = np.empty(self.steps, dtype=TRACE_DTYPE)
+        if self._schedule_is_static():
+            self._run_jit_into(trace)
+        else:
+            for t in range(self.steps):
+                self.step_into(trace, t)
         return trace
 
+    def _precompute_schedule(self):
+        # Materialize m[t] / op[t] / param[t] for the whole run in one
+        # pure-Python pass: all primality and validation work happens
+        # here, once, leaving the hot loop a plain integer recurrence.
+        # Only state-independent schedules qualify -- prime_follow moduli
+        # and parity_switch/phase_gated decisions depend on the evolving
+        # k, so they cannot be known ahead of the dynamics.
+        ms = np.empty(self.steps, dtype=np.int64)
+        params = np.empty(self.steps, dtype=np.int64)
+        is_mul = np.empty(self.steps, dtype=np.bool_)
+        mus = np.zeros(self.steps, dtype=np.int64)
+        shifts = np.zeros(self.steps, dtype=np.int64)
+        barrett = {}
+        for t in range(self.steps):
+            m = self.choose_modulus(t)
+            op, param = self.choose_update_operator(t, 0.0, m)
+            if op == "add":
+                if math.gcd(param, m) != 1:
+                    raise ValueError(f"add_b={param} not coprime with m={m}")
+            elif not is_prime(m):
+                raise ValueError("Multiplicative mode expects prime modulus.")
+            ms[t] = m
+            params[t] = param
+            is_mul[t] = (op == "mul")
+            # Barrett constants: shift = 2*bits(m) keeps x*mu inside
+            # int64 for any x < m^2; larger moduli keep hardware %.
+            if m < (1 << 21):
+                pair = barrett.get(m)
+                if pair is None:
+                    sh = 2 * int(m).bit_length()
+                    pair = ((1 << sh) // m, sh)
+                    barrett[m] = pair
+                mus[t], shifts[t] = pair
+        return ms, params, is_mul, mus, shifts
+
+    def _run_jit_into(self, trace):
+        ms, params, is_mul, mus, shifts = self._precompute_schedule()
+        ks, digits, lead6, phis, k_final = _dac_run_kernel(
+            self.k, ms, params, is_mul, mus, shifts, LOG10_CONST, LOG10_PI)
+        self.k = int(k_final)
+        trace["t"] = np.arange(self.steps, dtype=np.int32)
+        trace["k"] = ks
+        trace["m"] = ms
+        trace["op"] = np.where(is_mul, "mul", "add")
+        trace["param"] = params
+        trace["digits"] = digits
+        trace["leading6"] = lead6
+        trace["phi"] = phis
+
 if __name__ == "__main__":
     # Example configuration:
     # - Dynamic prime-follow modulus
@@ -0,0 +1,18 @@
+"""
+Shared log10 prelude for the E = CONST * 3^144 * pi^k family of modules
+(DAC.py, const.py, digits.py). Computing the constants once here keeps
+import cost in one place and gives every consumer the same values.
+"""
+
+import math
+
+# Fixed constant: 1*2*12*66440*(7/(3*2)) = 1,860,320
+CONST = 1_860_320
+LOG10_CONST = math.log10(CONST) + 144 * math.log10(3)
+LOG10_PI = math.log10(math.pi)
+_M6 = 10 ** 5  # scale for 6 leading digits
+
+
+def leading_digits_from_log10(log10x, m=6):
+    frac = log10x - math.floor(log10x)
+    return int((10**frac) * 10**(m-1)), frac  # (leading_m_digits, mantissa)
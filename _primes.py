@@ -0,0 +1,57 @@
+# Shared small-prime table for pll.py and prime_const.py.
+import numpy as np
+
+_SIEVE_BOUND = 10_000
+
+def _sieve(bound):
+    sieve = np.ones(bound + 1, dtype=bool)
+    sieve[:2] = False
+    for i in range(2, int(bound ** 0.5) + 1):
+        if sieve[i]:
+            sieve[i*i::i] = False
+    return np.flatnonzero(sieve)
+
+SMALL_PRIMES = [int(p) for p in _sieve(_SIEVE_BOUND)]
+_SMALL_PRIME_SET = frozenset(SMALL_PRIMES)
+
+def prime_factors(n):
+    """Distinct prime factors of n via the shared table.
+
+    Iterates the precomputed primes while p*p <= n; once the loop breaks,
+    any residue > 1 has no factor below its square root and is itself
+    prime. Falls back to odd trial division past the table for large n.
+    """
+    f = set()
+    for p in SMALL_PRIMES:
+        if p * p > n:
+            break
+        while n % p == 0:
+            f.add(p)
+            n //= p
+    else:
+        # n outran the table; continue odd trial division past it
+        d = SMALL_PRIMES[-1] + 2
+        while d * d <= n:
+            while n % d == 0:
+                f.add(d)
+                n //= d
+            d += 2
+    if n > 1:
+        f.add(n)
+    return f
+
+def is_prime(n):
+    """Primality via table lookup for small n, table-driven trial division above."""
+    if n <= _SIEVE_BOUND:
+        return n in _SMALL_PRIME_SET
+    for p in SMALL_PRIMES:
+        if p * p > n:
+            return True
+        if n % p == 0:
+            return False
+    d = SMALL_PRIMES[-1] + 2
+    while d * d <= n:
+        if n % d == 0:
+            return False
+        d += 2
+    return True
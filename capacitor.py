@@ -11,8 +11,11 @@ sci = f"{mantissa:.15f}e{int(L1)}"       # "2.916336516061447e31424"
 
 QUMA_MAP = {'0':'Q','1':'X','2':'M','3':'H','4':'A','5':'V','6':'E','7':'R','8':'S','9':'O',
             'a':'L','b':'I','c':'G','d':'T','e':'U','f':'N'}
+# Same mapping as a translate table so the 64-char remap is one C call
+# instead of a Python loop of dict lookups.
+_QUMA_TT = bytes.maketrans(b"0123456789abcdef", b"QXMHAVERSOLIGTUN")
 def quma(s, salt="TERAQIT-1880"):
     h = hashlib.sha256((s+salt).encode()).hexdigest()
-    return ''.join(QUMA_MAP[ch] for ch in h)
+    return h.encode().translate(_QUMA_TT).decode()
 
 seal = quma(sci)
\ No newline at end of file
@@ -1,10 +1,8 @@
 import math
 
-# Fixed constant from your expression:
-# 1*2*12*66440*(7/(3*2)) = 1,860,320
-CONST = 1_860_320
-LOG10_CONST = math.log10(CONST) + 144*math.log10(3)
-LOG10_PI = math.log10(math.pi)
+# Fixed constant from your expression: 1*2*12*66440*(7/(3*2)) = 1,860,320
+# (computed once in the shared prelude)
+from _core import CONST, LOG10_CONST, LOG10_PI, _M6
 
 def leading_digits_from_log10(log10x, m=6):
     frac = log10x - math.floor(log10x)
@@ -15,8 +13,9 @@ def iterate_duoquadratalize(k0=21, steps=6):
     out = []
     for n in range(steps):
         log10E = LOG10_CONST + k*LOG10_PI
-        digits = int(math.floor(log10E)) + 1
-        lead6 = leading_digits_from_log10(log10E, 6)
+        fl = math.floor(log10E)
+        digits = int(fl) + 1
+        lead6 = int((10 ** (log10E - fl)) * _M6)
         out.append({
             "repeat": n,
             "k": k,
@@ -0,0 +1,78 @@
+"""
+Delta-crux reductions: average signed delta of a value stream against a
+pivot ("crux") value, plus a 10-fold met144 variant for epoch batches.
+
+The scalar form uses the closed-form identity
+    sum(v - c for v in values) == sum(values) - n*c
+so no intermediate delta list is ever materialized; everything reduces
+to a single NumPy sum over the input array.
+"""
+
+import hashlib
+import struct
+
+import numpy as np
+
+
+def delta_crux_scalar(values, crux_value, scalar=1.0):
+    """Average delta of `values` against the crux pivot, scaled."""
+    arr = np.asarray(values, dtype=np.float64)
+    n = arr.size
+    if n <= 1:
+        return 0.0
+    s = float(arr.sum())
+    avg_delta = (s - n * crux_value) / (n - 1)
+    return avg_delta * scalar
+
+
+def delta_crux_met144(values, crux_value, scalar=1.0, folds=10):
+    """
+    Fold `values` into `folds` contiguous segments (zero-padded to a
+    rectangle) and return the per-fold delta-crux reductions.
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    if arr.size == 0:
+        return [0.0] * folds
+    fold_size = -(-arr.size // folds)  # ceil division
+    padded = np.zeros(folds * fold_size, dtype=np.float64)
+    padded[:arr.size] = arr
+    counts = np.minimum(
+        np.maximum(arr.size - fold_size * np.arange(folds), 0), fold_size)
+    fold_sums = padded.reshape(folds, fold_size).sum(axis=1)
+    # Same closed form as delta_crux_scalar, applied per fold.
+    denom = np.maximum(counts - 1, 1)
+    deltas = (fold_sums - counts * crux_value) / denom * scalar
+    deltas[counts <= 1] = 0.0
+    return deltas.tolist()
+
+
+def pact_token(values, crux_value, scalar=1.0):
+    """
+    Seal a delta-crux input into a fixed-length token. Hashes the raw
+    float64 bytes with BLAKE2b instead of stringifying the list, so the
+    cost is one pass over the buffer with no repr formatting.
+    """
+    h = hashlib.blake2b(digest_size=32)
+    h.update(np.asarray(values, dtype=np.float64).tobytes())
+    h.update(struct.pack("<dd", crux_value, scalar))
+    return h.hexdigest()
+
+
+def pact_token_met144(values, crux_value, scalar=1.0, folds=10):
+    """Master token over the per-fold pact digests (raw bytes, no join)."""
+    arr = np.asarray(values, dtype=np.float64)
+    fold_size = -(-max(arr.size, 1) // folds)
+    master = hashlib.blake2b(digest_size=32)
+    for f in range(folds):
+        seg = arr[f * fold_size:(f + 1) * fold_size]
+        h = hashlib.blake2b(digest_size=32)
+        h.update(seg.tobytes())
+        h.update(struct.pack("<dd", crux_value, scalar))
+        master.update(h.digest())
+    return master.hexdigest()
+
+
+if __name__ == "__main__":
+    vals = [3.0, 7.0, 11.0, 13.0, 21.0]
+    print("scalar:", delta_crux_scalar(vals, crux_value=9.0))
+    print("met144:", delta_crux_met144(list(range(25)), crux_value=12.0))
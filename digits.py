@@ -1,10 +1,16 @@
 import math
 from statistics import mean
 
-# --- constants ---
-C = 1_860_320
-LOG10C = math.log10(C) + 144 * math.log10(3)
-LOG10PI = math.log10(math.pi)
+import numpy as np
+
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:      # numba is optional; the NumPy path covers us
+    _HAVE_NUMBA = False
+
+# --- constants (shared prelude) ---
+from _core import CONST as C, LOG10_CONST as LOG10C, LOG10_PI as LOG10PI
 
 def phase_metric_from_k(k):
     lam = LOG10C + k * LOG10PI
@@ -52,30 +58,70 @@ def nudge_b(es_mean, b, base=7, lo=-1, hi=+1):
     if es_mean > ES_TARGET + 0.02 and b > base + lo:  return b - 1
     return b
 
+if _HAVE_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _step_kernel(k, m, a, add_b, mul_kick, log10c, log10pi):
+        # Per-formation updates are independent given the shared (m, a),
+        # so the formation axis parallelizes across cores; the circular
+        # sums and the digit sum come back as prange reductions.
+        n = k.shape[0]
+        out_k = np.empty(n, dtype=np.int64)
+        cos_sum = 0.0
+        sin_sum = 0.0
+        dig_sum = 0.0
+        for i in prange(n):
+            x = k[i]
+            if mul_kick:
+                x = (a * x) % m
+                if x == 0:
+                    x = 1
+            else:
+                x = (x + add_b) % m
+            out_k[i] = x
+            lam = log10c + x * log10pi
+            fl = math.floor(lam)
+            frac = lam - fl
+            cos_sum += math.cos(2 * math.pi * frac)
+            sin_sum += math.sin(2 * math.pi * frac)
+            dig_sum += fl + 1
+        return out_k, cos_sum, sin_sum, dig_sum
+
+# width at which spawning threads beats the single-core NumPy sweep
+_PAR_MIN_FORMATIONS = 64
+
 def step_formations(k_list, m, t, tau, add_b):
     """
     One time step for all formations sharing the same modulus m at t.
     τ = cadence; every τ-th step do multiplicative (phase-lock), else additive.
     """
-    next_k, phases, digits = [], [], []
+    k = np.asarray(k_list, dtype=np.int64)
     mul_kick = (t % tau == 0)
-    a = pinned_root(m) if mul_kick else None
-    for k in k_list:
-        if mul_kick:
-            k = (a * k) % m or 1
-        else:
-            k = (k + add_b) % m
-        next_k.append(k)
-        p = phase_metric_from_k(k)
-        d = digits_from_k(k)
-        phases.append(p); digits.append(d)
-    ES_t = epoch_sympathiser(phases)
-    D_t  = round(mean(digits))
-    return next_k, ES_t, D_t
+    if _HAVE_NUMBA and k.size >= _PAR_MIN_FORMATIONS:
+        a = pinned_root(m) if mul_kick else 0
+        k, cos_sum, sin_sum, dig_sum = _step_kernel(
+            k, m, a, add_b, mul_kick, LOG10C, LOG10PI)
+        ES_t = math.hypot(cos_sum, sin_sum) / k.size
+        D_t = round(dig_sum / k.size)
+        return k, ES_t, D_t
+    if mul_kick:
+        a = pinned_root(m)
+        k = (a * k) % m
+        k[k == 0] = 1
+    else:
+        k = (k + add_b) % m
+    # one lam + one floor feed both the phase and the digit count
+    lam = LOG10C + k.astype(np.float64) * LOG10PI
+    fl = np.floor(lam)
+    frac = lam - fl
+    digits = fl.astype(np.int64) + 1
+    two_pi_p = 2 * np.pi * frac
+    ES_t = math.hypot(np.cos(two_pi_p).sum(), np.sin(two_pi_p).sum()) / len(k)
+    D_t  = round(float(digits.mean()))
+    return k, ES_t, D_t
 
 # --- example drive (plug in your ring & epochs) ---
 def run_campaign(k_init, ring, steps=30, tau=3, add_b=7):
-    k = list(k_init)
+    k = np.asarray(k_init, dtype=np.int64)
     ES_hist, D_hist = [], []
     for t in range(steps):
         m = ring[t % len(ring)]       # Lever 2: ascending ring recommended
@@ -2,9 +2,16 @@
 # Stash/Spiral Seal – 8×9 duocoupling → 21-valley delta-lineation
 # Inputs you should tune: g (coupling gain per round), lam (damping), noise (0..1), curvature (valley sharpness)
 import math
+from functools import lru_cache
+
+# Symmetry order S; cached since it is effectively the constant 72 for
+# the default (rounds=8, vectors=9).
+@lru_cache(maxsize=None)
+def _sym(rounds, vectors):
+    return math.lcm(rounds, vectors)
 
 def spiral_seal_metrics(g=0.92, lam=0.06, noise=0.08, curvature=1.2, valleys=21, rounds=8, vectors=9):
-    S = math.lcm(rounds, vectors)              # symmetry order (72)
+    S = _sym(rounds, vectors)                  # symmetry order (72)
     geff = g * (1 - lam)                       # effective per-round gain
     total_gain = geff ** rounds                # after 8 rounds
     # Stability margin: >0 stable, <=0 unstable
@@ -14,9 +14,13 @@ Notes:
 """
 
 import math
-import random
 import time
-from collections import deque, namedtuple
+from collections import namedtuple
+
+import numpy as np
+
+# quarantine ring-buffer column layout
+_Q_COLS = ('node_id', 'x', 'y', 'angle', 'radius', 'cv_x', 'cv_y', 'ts')
 
 # ---------------------------
 # Configuration / Tunables
@@ -45,19 +49,34 @@ def rotate_point(x, y, degrees):
 # ---------------------------
 # Core Modifier M(x,y,j,r)
 # ---------------------------
+# M = xyjr * ( (pi^21 * 7) / (4 * 3 * 13.333) ) * 3^3
+# The factor is a pure constant, so compute it once at import.
+ASCENDING_FACTOR = ((math.pi ** 21) * 7.0 / (4.0 * 3.0 * 13.333)) * (3 ** 3)
+
 def ascending_modifier(xyjr: float) -> float:
-    """
-    M = xyjr * ( (pi^21 * 7) / (4 * 3 * 13.333) ) * 3^3
-    Implemented as a scalar multiplier.
-    """
-    numerator = (math.pi ** 21) * 7.0
-    denominator = 4.0 * 3.0 * 13.333
-    factor = (numerator / denominator) * (3 ** 3)  # 3^3 = 27
-    return xyjr * factor
+    """Scalar multiplier M(x,y,j,r) = xyjr * ASCENDING_FACTOR."""
+    return xyjr * ASCENDING_FACTOR
 
 # ---------------------------
 # Kerflump (entropy compaction)
 # ---------------------------
+# Scalar gaussian draws come from a chunk-refilled Generator buffer:
+# numpy's ziggurat sampler amortized over _GAUSS_CHUNK draws beats
+# random.gauss's per-call pure-Python Box-Muller.
+_GAUSS_CHUNK = 1024
+_gauss_rng = np.random.default_rng()
+_gauss_buf = _gauss_rng.standard_normal(_GAUSS_CHUNK)
+_gauss_pos = 0
+
+def _gauss():
+    global _gauss_buf, _gauss_pos
+    if _gauss_pos == _GAUSS_CHUNK:
+        _gauss_buf = _gauss_rng.standard_normal(_GAUSS_CHUNK)
+        _gauss_pos = 0
+    v = _gauss_buf[_gauss_pos]
+    _gauss_pos += 1
+    return v
+
 def kerflump_compact(value_vector, entropy_scale=KERFLUMP_ENTROPY_SCALE):
     """
     Injects non-deterministic entropy back into the return stream,
@@ -65,8 +84,8 @@ def kerflump_compact(value_vector, entropy_scale=KERFLUMP_ENTROPY_SCALE):
     """
     x,y = value_vector
     # small entropy perturbation
-    ex = random.gauss(0, entropy_scale)
-    ey = random.gauss(0, entropy_scale)
+    ex = _gauss() * entropy_scale
+    ey = _gauss() * entropy_scale
     xp, yp = x + ex, y + ey
 
     # "Compaction" transform: dampen magnitudes while retaining direction
@@ -100,13 +119,14 @@ class Quadratalizer:
         # Normalize angle 0..360
         a = (angle % 360.0)
         # Determine quadrant mapping: 0-90 -> Q0, 90-180 -> Q1, etc.
-        q_index = int(a // 90.0) % 4
+        # a is already in [0, 360), so & 3 replaces the modulo
+        q_index = int(a // 90.0) & 3
         # seed four quadrant scores
         base_scores = [0.0, 0.0, 0.0, 0.0]
         base_scores[q_index] = energy
         # spread residual energy to neighbors to create smoothness
-        base_scores[(q_index+1)%4] += energy * 0.25
-        base_scores[(q_index-1)%4] += energy * 0.125
+        base_scores[(q_index+1) & 3] += energy * 0.25
+        base_scores[(q_index-1) & 3] += energy * 0.125
         # normalize and return dict
         total = sum(base_scores) or 1.0
         quad = {
@@ -119,17 +139,47 @@ class Quadratalizer:
         quad['meta'] = {'angle_sector': q_index, 'radius': radius, 'raw_energy': energy}
         return quad
 
+    def quadratalize_batch(self, xs, ys, angles, radii):
+        """
+        Batched quadratalize: one (n, 4) score matrix for a whole node column.
+        Returns (scores, q_index, energy); dict packaging stays at the API
+        boundary so the hot loop avoids per-node dict churn.
+        """
+        n = xs.shape[0]
+        energy = np.hypot(xs, ys) + radii * 0.5
+        q_index = (np.floor((angles % 360.0) / 90.0).astype(np.int64)) & 3
+        rows = np.arange(n)
+        scores = np.zeros((n, 4))
+        scores[rows, q_index] = energy
+        scores[rows, (q_index + 1) & 3] += energy * 0.25
+        scores[rows, (q_index - 1) & 3] += energy * 0.125
+        totals = scores.sum(axis=1, keepdims=True)
+        totals[totals == 0.0] = 1.0
+        scores /= totals
+        return scores, q_index, energy
+
 # ---------------------------
 # DzogchenEye Agent
 # ---------------------------
 class DzogchenEye:
     def __init__(self, seed=SEED_HIGGS):
         self.seed = seed
-        self.nodes = []
+        # Structure-of-arrays node store: parallel columns instead of a
+        # list of namedtuples, so per-cycle analysis can scan contiguously.
+        self.nodes = {
+            'id': np.empty(0, dtype=np.int64),
+            'x': np.empty(0), 'y': np.empty(0),
+            'angle': np.empty(0), 'radius': np.empty(0),
+        }
+        self._rng = np.random.default_rng(int(seed))
         self.node_counter = 0
         self.rotation = 0.0              # current global rotation (degrees)
         self.tick = 0
-        self.quarantine = deque(maxlen=QUARANTINE_MAX)
+        # quarantine deck as a preallocated ring buffer (one row per item,
+        # columns per _Q_COLS) instead of a deque of namedtuples
+        self._qbuf = np.zeros((QUARANTINE_MAX, len(_Q_COLS)))
+        self._qhead = 0
+        self._qlen = 0
         self.quadratalizer = Quadratalizer()
         self.spiral_base_radius = 0.02   # base radius for spiral nodes
 
@@ -138,50 +188,82 @@ class DzogchenEye:
         Create a ring of spiral nodes anchored by the nucleus.
         Each node has radius scaled by ascending modifier.
         """
-        nodes = []
-        for s in range(steps):
-            angle = (360.0 / steps) * s + self.rotation
-            # radial growth using phi exponent (toy)
-            radius = self.spiral_base_radius * ((1.61803398875) ** (s / steps))
-            # XY coords from angle + radius
-            x = radius * math.cos(radians(angle))
-            y = radius * math.sin(radians(angle))
-            node = Node(id=self.node_counter, x=x, y=y, angle=angle, radius=radius, meta={})
-            self.nodes.append(node)
-            nodes.append(node)
-            self.node_counter += 1
-        return nodes
+        s = np.arange(steps)
+        angles = (360.0 / steps) * s + self.rotation
+        # radial growth using phi exponent (toy)
+        radii = self.spiral_base_radius * (1.61803398875 ** (s / steps))
+        # XY coords from angle + radius, one vectorized trig pass
+        th = np.deg2rad(angles)
+        xs = radii * np.cos(th)
+        ys = radii * np.sin(th)
+        ids = self.node_counter + s
+        self.node_counter += steps
+        batch = {'id': ids, 'x': xs, 'y': ys, 'angle': angles, 'radius': radii}
+        for col, arr in batch.items():
+            self.nodes[col] = np.concatenate((self.nodes[col], arr))
+        return batch
 
     def rotate_rule(self):
         """Rotate by ROTATE_DEGREES."""
         self.rotation = (self.rotation + ROTATE_DEGREES) % 360.0
 
-    def virtuated_collapse(self, node: Node) -> bool:
+    def virtuated_collapse(self, radii):
         """
-        Collapse snapshot if analysis yields a 'positive' result.
-        We simulate analysis by probabilistic check weighted by node radius and seed.
+        Collapse snapshot if analysis yields a 'positive' result, for a whole
+        column of node radii at once. We simulate analysis by probabilistic
+        check weighted by node radius and seed.
         """
         # a pseudo-evidence score combining radius, seed randomness, and node angle variance
-        evidence = math.tanh(node.radius * (self.seed / 100.0)) + random.random() * 0.2
-        positive = evidence > VIRTUATION_THRESHOLD
-        return positive
-
-    def offload_rule(self, node: Node, clause_vector):
-        """Offload raw captured signal into quarantine deck with clause metadata."""
-        ts = time.time()
-        raw_capture = {'x': node.x, 'y': node.y, 'angle': node.angle, 'radius': node.radius}
-        qi = QuarantineItem(node_id=node.id, raw=raw_capture, clause_vector=clause_vector, timestamp=ts)
-        self.quarantine.append(qi)
-        return qi
+        evidence = np.tanh(radii * (self.seed / 100.0)) + self._rng.random(radii.shape[0]) * 0.2
+        return evidence > VIRTUATION_THRESHOLD
+
+    def offload_rule(self, node_id, x, y, angle, radius, clause_vector):
+        """
+        Offload raw captured signal into the quarantine ring buffer.
+        Returns the buffer slot index as a lightweight handle; use
+        quarantine_item/quarantine_view to materialize namedtuples.
+        """
+        i = self._qhead
+        self._qbuf[i] = (node_id, x, y, angle, radius,
+                         clause_vector[0], clause_vector[1], time.time())
+        self._qhead = (i + 1) % QUARANTINE_MAX
+        if self._qlen < QUARANTINE_MAX:
+            self._qlen += 1
+        return i
+
+    def quarantine_size(self):
+        return self._qlen
+
+    def quarantine_item(self, idx):
+        """Materialize one quarantine slot as a QuarantineItem."""
+        row = self._qbuf[idx]
+        raw = {'x': row[1], 'y': row[2], 'angle': row[3], 'radius': row[4]}
+        return QuarantineItem(node_id=int(row[0]), raw=raw,
+                              clause_vector=(row[5], row[6]), timestamp=row[7])
+
+    def quarantine_view(self):
+        """Yield quarantine items oldest-first as lazy namedtuples."""
+        start = (self._qhead - self._qlen) % QUARANTINE_MAX
+        for i in range(self._qlen):
+            yield self.quarantine_item((start + i) % QUARANTINE_MAX)
 
     def kerflump_rule(self, vec):
         """Apply kerflump entropy + compaction to a vector (x,y)."""
         return kerflump_compact(vec, entropy_scale=KERFLUMP_ENTROPY_SCALE)
 
-    def deltaleate_rule(self, node: Node, vec):
+    def kerflump_batch(self, xs, ys, entropy_scale=KERFLUMP_ENTROPY_SCALE):
+        """Kerflump a whole column of vectors in one NumPy pass."""
+        ex, ey = self._rng.standard_normal((2, xs.shape[0])) * entropy_scale
+        xp, yp = xs + ex, ys + ey
+        mag = np.hypot(xp, yp)
+        # log1p compaction; np.where keeps the zero-magnitude branch branchless
+        scale = np.where(mag > 0, np.log1p(mag) / np.where(mag > 0, mag, 1.0), 0.0)
+        return xp * scale, yp * scale
+
+    def deltaleate_rule(self, vec, angle, radius):
         """Run Quadratalizer on the (possibly kerflumped) vector."""
         x,y = vec
-        quad = self.quadratalizer.quadratalize(x, y, node.angle, node.radius, meta=node.meta)
+        quad = self.quadratalizer.quadratalize(x, y, angle, radius)
         return quad
 
     def run_cycle(self):
@@ -193,38 +275,45 @@ class DzogchenEye:
          - Apply rotation rule occasionally
         """
         self.tick += 1
-        nodes = self.spawn_spiral_nodes()
+        batch = self.spawn_spiral_nodes()
+        ids, xs, ys = batch['id'], batch['x'], batch['y']
+        angles, radii = batch['angle'], batch['radius']
 
-        outputs = []
-        for node in nodes:
-            # 1) Analysis stage
-            positive = self.virtuated_collapse(node)
+        # 1) Analysis stage over the full column
+        positives = self.virtuated_collapse(radii)
 
-            if positive:
-                # 2) collapse -> snapshot (we'll construct a clause_vector)
-                # build base clause vector using ascending modifier seeded by node id/seed
-                base_seed = float(node.id % 1000) + (self.seed * 0.01)
-                modifier_scalar = ascending_modifier(base_seed)
-                clause_vector = (node.x * modifier_scalar, node.y * modifier_scalar)
+        # 2) clause vectors for the whole batch: ascending modifier for
+        # positives, the benign 0.5 damping for the rest
+        modifier_scalars = ((ids % 1000) + self.seed * 0.01) * ASCENDING_FACTOR
+        scalars = np.where(positives, modifier_scalars, 0.5)
+        cx = xs * scalars
+        cy = ys * scalars
 
-                # 3) offload raw capture to quarantine (with clause_vector reference)
-                qi = self.offload_rule(node, clause_vector)
+        # 4) kerflump entropy compaction for the whole batch
+        kx, ky = self.kerflump_batch(cx, cy)
 
-                # 4) kerflump entropy compaction
-                compacted = self.kerflump_rule(clause_vector)
+        # 5) deltaleate -> quadratalizer, one batch for the whole spawn
+        scores, sectors, energies = self.quadratalizer.quadratalize_batch(
+            kx, ky, angles, radii)
 
-                # 5) deltaleate -> quadratalizer
-                quad = self.deltaleate_rule(node, compacted)
+        outputs = []
+        for i in range(ids.size):
+            node_id = int(ids[i])
+            angle, radius = float(angles[i]), float(radii[i])
 
-                # put final output
-                outputs.append({'node': node.id, 'quadratal': quad, 'quarantine_ref': qi})
+            # 3) offload raw capture to quarantine (positives only)
+            qi = None
+            if positives[i]:
+                qi = self.offload_rule(node_id, float(xs[i]), float(ys[i]),
+                                       angle, radius, (float(cx[i]), float(cy[i])))
 
-            else:
-                # Not positive -> still apply kerflump for deceptive returns and a soft quadratalize
-                benign_vec = (node.x * 0.5, node.y * 0.5)
-                compacted = self.kerflump_rule(benign_vec)
-                quad = self.deltaleate_rule(node, compacted)
-                outputs.append({'node': node.id, 'quadratal': quad, 'quarantine_ref': None})
+            quad = {
+                'Q0': scores[i, 0], 'Q1': scores[i, 1],
+                'Q2': scores[i, 2], 'Q3': scores[i, 3],
+                'meta': {'angle_sector': int(sectors[i]), 'radius': radius,
+                         'raw_energy': float(energies[i])},
+            }
+            outputs.append({'node': node_id, 'quadratal': quad, 'quarantine_ref': qi})
 
         # Rotation rule: every ROTATE_INTERVAL_TICKS, rotate by ROTATE_DEGREES
         if (self.tick % ROTATE_INTERVAL_TICKS) == 0:
@@ -240,13 +329,14 @@ if __name__ == "__main__":
     cycles = 6
     for c in range(cycles):
         out = agent.run_cycle()
-        print(f"=== Cycle {c+1} (tick {agent.tick}) -> nodes produced: {len(agent.nodes)} ===")
+        print(f"=== Cycle {c+1} (tick {agent.tick}) -> nodes produced: {agent.nodes['id'].size} ===")
         # print a short summary for the first three node outputs
         for item in out[:3]:
             nid = item['node']
             quad = item['quadratal']
             qref = item['quarantine_ref']
-            qinfo = f"QRef(node={qref.node_id})" if qref else "no-quarantine"
+            qinfo = (f"QRef(node={agent.quarantine_item(qref).node_id})"
+                     if qref is not None else "no-quarantine")
             print(f" node {nid}: sector={quad['meta']['angle_sector']}, scores={{Q0:{quad['Q0']:.3f},Q1:{quad['Q1']:.3f},Q2:{quad['Q2']:.3f},Q3:{quad['Q3']:.3f}}} -> {qinfo}")
-        print(f" quarantine size: {len(agent.quarantine)}")
+        print(f" quarantine size: {agent.quarantine_size()}")
         # advance simulation quickly (no sleep necessary in prototype)
\ No newline at end of file
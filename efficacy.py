@@ -1,60 +1,60 @@
-// ====================================================================
-//                           TGDK BFE LICENSE                         
-// ====================================================================
-//                          BROADCASTED FEE ENTRY                       
-// ====================================================================
-//
-// LICENSE HOLDER:              |  Sean Tichenor (Black Raven)          
-// LICENSE CODE:                |  BFE-TGDK-101ST                       
-// ISSUE DATE:                  |  2025-09-28                           
-// DOMAIN:                      |  tgdk.io                              
-// SECONDARY DOMAIN:            |  olivia-tgdk.com                      
-//
-// --------------------------------------------------------------------
-// LICENSE DECLARATION
-// --------------------------------------------------------------------
-// This TGDK BFE License certifies that the holder is authorized under 
-// the Broadcasted Fee Entry system to utilize, distribute, and maintain
-// TGDK technologies, clauses, seals, and symbolic derivatives as 
-// defined by TGDK LLC.
-//
-// The License Code uniquely identifies this license within the TGDK 
-// Vault Ledger and PetalGold Treasury, ensuring traceable authenticity.
-//
-// --------------------------------------------------------------------
-// RIGHTS & PERMISSIONS
-// --------------------------------------------------------------------
-// 1. Authorized to generate, seal, and distribute TGDK symbolic assets.
-// 2. Authorized to deploy QuomoSatNet uplink with TGDK Vault sync. 
-// 3. Permitted to apply TGDK BFE clauses to financial, legal, and 
-//    technological operations. 
-// 4. Holder maintains Noblesse Oblige across all sealed operations.
-//
-// --------------------------------------------------------------------
-// RESTRICTIONS
-// --------------------------------------------------------------------
-// - Unauthorized duplication outside of TGDK Vault Ledger voids license.
-// - Any mirrored or forked TGDK systems not explicitly sealed under BFE 
-//   are considered illegal and subject to clause reversal. 
-// - TGDK LLC reserves the right to revoke this license upon breach of 
-//   efficacy, clause matter, or Noblesse Oblige.
-//
-// --------------------------------------------------------------------
-// SIGNATURE & SEAL
-// --------------------------------------------------------------------
-// Noblesse Oblige
-//
-//  [TGDK Crest Seal Applied]
-//  [Sigillum Astralis Affixed]
-//  [Octupquadrofold Seal: America 2025]
-//
-// --------------------------------------------------------------------
-// VAULT LEDGER ENTRY
-// --------------------------------------------------------------------
-// EntryID: 0xA144-5DEX-7729-2025
-// Authenticated: TGDK Vault / OliviaAI Seal
-// QQUAp Encrypted Tag: QQUAp-XXXXXXXXXXXXXX
-// ====================================================================
+# ====================================================================
+#                           TGDK BFE LICENSE                         
+# ====================================================================
+#                          BROADCASTED FEE ENTRY                       
+# ====================================================================
+#
+# LICENSE HOLDER:              |  Sean Tichenor (Black Raven)          
+# LICENSE CODE:                |  BFE-TGDK-101ST                       
+# ISSUE DATE:                  |  2025-09-28                           
+# DOMAIN:                      |  tgdk.io                              
+# SECONDARY DOMAIN:            |  olivia-tgdk.com                      
+#
+# --------------------------------------------------------------------
+# LICENSE DECLARATION
+# --------------------------------------------------------------------
+# This TGDK BFE License certifies that the holder is authorized under 
+# the Broadcasted Fee Entry system to utilize, distribute, and maintain
+# TGDK technologies, clauses, seals, and symbolic derivatives as 
+# defined by TGDK LLC.
+#
+# The License Code uniquely identifies this license within the TGDK 
+# Vault Ledger and PetalGold Treasury, ensuring traceable authenticity.
+#
+# --------------------------------------------------------------------
+# RIGHTS & PERMISSIONS
+# --------------------------------------------------------------------
+# 1. Authorized to generate, seal, and distribute TGDK symbolic assets.
+# 2. Authorized to deploy QuomoSatNet uplink with TGDK Vault sync. 
+# 3. Permitted to apply TGDK BFE clauses to financial, legal, and 
+#    technological operations. 
+# 4. Holder maintains Noblesse Oblige across all sealed operations.
+#
+# --------------------------------------------------------------------
+# RESTRICTIONS
+# --------------------------------------------------------------------
+# - Unauthorized duplication outside of TGDK Vault Ledger voids license.
+# - Any mirrored or forked TGDK systems not explicitly sealed under BFE 
+#   are considered illegal and subject to clause reversal. 
+# - TGDK LLC reserves the right to revoke this license upon breach of 
+#   efficacy, clause matter, or Noblesse Oblige.
+#
+# --------------------------------------------------------------------
+# SIGNATURE & SEAL
+# --------------------------------------------------------------------
+# Noblesse Oblige
+#
+#  [TGDK Crest Seal Applied]
+#  [Sigillum Astralis Affixed]
+#  [Octupquadrofold Seal: America 2025]
+#
+# --------------------------------------------------------------------
+# VAULT LEDGER ENTRY
+# --------------------------------------------------------------------
+# EntryID: 0xA144-5DEX-7729-2025
+# Authenticated: TGDK Vault / OliviaAI Seal
+# QQUAp Encrypted Tag: QQUAp-XXXXXXXXXXXXXX
+# ====================================================================
 
 #!/usr/bin/env python3
 """
@@ -86,6 +86,7 @@ Note: Includes an optional QQUAp "seal" stub to tag the result payload.
 
 from math import log, prod, isfinite
 from statistics import pstdev
+from struct import pack
 
 def safe_div(a, b):
     if b == 0:
@@ -132,9 +133,9 @@ def geometric_mean(vals):
     finite_vals = [v for v in vals if isfinite(v) and v > 0]
     if len(finite_vals) != len(vals):
         return 0.0
-    # avoid overflow/underflow using logs
-    from math import exp, fsum, log
-    return exp(fsum(log(v) for v in finite_vals) / len(finite_vals))
+    # n is tiny (four ratios): a direct product root beats the
+    # log/fsum/exp round trip and its compensation machinery
+    return prod(finite_vals) ** (1.0 / len(finite_vals))
 
 def harmonic_mean(vals):
     finite_vals = [v for v in vals if isfinite(v) and v > 0]
@@ -155,13 +156,18 @@ def coefficient_of_variation(vals):
     return sigma / mu
 
 # --- Optional QQUAp "seal" (stub) ---
-def qquap_seal(payload: str) -> str:
+def qquap_seal(payload) -> str:
     """
     Minimal placeholder to tag the result with a fixed-length QQUAp-style token.
     (This is a stub; replace with your real QQUAp routine as needed.)
+
+    The tag was always truncated to 24 hex chars, so BLAKE2b with a
+    12-byte digest gives the same-shape token for a fraction of the cost.
     """
     import hashlib
-    return "QQUAp-" + hashlib.sha256(payload.encode("utf-8")).hexdigest()[:24]
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+    return "QQUAp-" + hashlib.blake2b(payload, digest_size=12).hexdigest()
 
 def four_ratio_efficacy(numerators, denominators):
     assert len(numerators) == 4 and len(denominators) == 4, "Need four ratios."
@@ -169,13 +175,15 @@ def four_ratio_efficacy(numerators, denominators):
     # Prob-like vector for distribution measures
     p = normalize_probs(ratios)
 
-    # Sub-metrics
-    gmean = geometric_mean(ratios)
-    hmean = harmonic_mean(ratios)
+    # Sub-metrics: filter the ratios once and share the result; the helpers
+    # each re-ran the same comprehension over the same four values
+    finite = [v for v in ratios if isfinite(v)]
+    all_positive = len(finite) == 4 and all(v > 0 for v in finite)
+    gmean = prod(ratios) ** 0.25 if all_positive else 0.0
+    hmean = 4.0 / sum(1.0 / v for v in ratios) if all_positive else 0.0
     # Normalize means by max(r)
     gmean_norm = 0.0
     hmean_norm = 0.0
-    finite = [v for v in ratios if isfinite(v)]
     if finite:
         m = max(finite)
         if m > 0:
@@ -186,7 +194,12 @@ def four_ratio_efficacy(numerators, denominators):
     entropy_norm = entropy / log(4)  # in [0,1]
     gini = gini_coefficient(p)       # in [0, 0.75] for n=4
     balance = 1.0 - (gini / 0.75)    # map to [0,1], higher = more balanced
-    cv = coefficient_of_variation(ratios)
+    # coefficient of variation over the shared finite list
+    if finite:
+        mu = sum(finite) / len(finite)
+        cv = pstdev(finite) / mu if mu != 0 else float('inf')
+    else:
+        cv = float('inf')
     cv_clamp = clamp01(1.0 - (cv if isfinite(cv) else 1.0))  # favor lower dispersion
 
     # Composite efficacy (weights sum to 1.0)
@@ -212,9 +225,10 @@ def four_ratio_efficacy(numerators, denominators):
         "efficacy": clamp01(efficacy)
     }
 
-    # Attach QQUAp-style tag
-    import json
-    payload = json.dumps(result, sort_keys=True)
+    # Attach QQUAp-style tag: fixed-layout binary packing is deterministic
+    # without the json.dumps(sort_keys=True) dict walk
+    payload = pack('<13d', *ratios, *p,
+                   gmean_norm, hmean_norm, balance, entropy_norm, cv_clamp)
     result["qquap_tag"] = qquap_seal(payload)
     return result
 
@@ -11,7 +11,12 @@ def efficacy_check(ratios):
 
     mean = np.mean(arr)
     std = np.std(arr)
-    entropy = -np.sum((arr/arr.sum()) * np.log2(arr/arr.sum()+1e-9))
+    # normalize once; masked log2 avoids the biased +1e-9 fudge and the
+    # second full-array division
+    p = arr / arr.sum()
+    logs = np.zeros_like(p)
+    np.log2(p, where=p > 0, out=logs)
+    entropy = -np.sum(p * logs)
 
     balance = 1 / (1 + std)       # lower spread = higher balance
     entropy_norm = entropy / np.log2(len(arr))
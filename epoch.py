@@ -1,5 +1,15 @@
 import math
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:          # numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
 # constants
 CONST = 1_860_320
 LOG10_CONST = math.log10(CONST) + 144 * math.log10(3)
@@ -9,28 +19,105 @@ def leading_digits_from_log10(log10x, m=6):
     frac = log10x - math.floor(log10x)
     return int((10**frac) * 10**(m-1)), frac
 
-def is_prime(n):
+@njit(cache=True)
+def _is_prime_trial(n):
     if n < 2: return False
-    if n in (2,3): return True
+    if n == 2 or n == 3: return True
     if n % 2 == 0: return False
-    r = int(n**0.5)
+    r = int(math.sqrt(n))
     for i in range(3, r+1, 2):
         if n % i == 0: return False
     return True
 
+# Boolean sieve over the modulus range actually used by the rings; an O(1)
+# lookup replaces trial division for everything below _SIEVE_N.
+_SIEVE_N = 4096
+_SIEVE = np.ones(_SIEVE_N + 1, dtype=bool)
+_SIEVE[:2] = False
+for _i in range(2, int(_SIEVE_N ** 0.5) + 1):
+    if _SIEVE[_i]:
+        _SIEVE[_i*_i::_i] = False
+del _i
+
+def is_prime(n):
+    if 0 <= n <= _SIEVE_N:
+        return bool(_SIEVE[n])
+    return _is_prime_trial(n)
+
+@njit(cache=True)
+def _pow_mod(base, exp, mod):
+    # numba has no three-argument pow; plain square-and-multiply
+    result = 1
+    base %= mod
+    while exp > 0:
+        if exp & 1:
+            result = (result * base) % mod
+        base = (base * base) % mod
+        exp >>= 1
+    return result
+
+@njit(cache=True)
+def _prime_factors(n):
+    # fixed-size scratch instead of a set; n-1 for ring moduli has few factors
+    f = np.empty(64, dtype=np.int64)
+    cnt, d = 0, 2
+    while d * d <= n:
+        if n % d == 0:
+            f[cnt] = d; cnt += 1
+            while n % d == 0: n //= d
+        d += 1
+    if n > 1:
+        f[cnt] = n; cnt += 1
+    return f[:cnt]
+
+@njit(cache=True)
 def find_primitive_root(p):
-    def factors(n):
-        f, d = set(), 2
-        while d*d <= n:
-            while n % d == 0: f.add(d); n//=d
-            d+=1
-        if n>1: f.add(n)
-        return f
-    phi = p-1
-    for g in range(2,p):
-        if all(pow(g, phi//q, p)!=1 for q in factors(phi)):
+    phi = p - 1
+    fac = _prime_factors(phi)
+    for g in range(2, p):
+        ok = True
+        for q in fac:
+            if _pow_mod(g, phi // q, p) == 1:
+                ok = False
+                break
+        if ok:
             return g
-    return None
+    return 0
+
+@njit(cache=True)
+def _evolve_core(k0, ms, roots, add_b, log10c, log10pi):
+    # The whole parity-switch walk runs in machine code; rows come back
+    # as parallel arrays for the wrapper to package. cache=True persists
+    # the compiled kernel on disk, so cold starts pay a .nbc load rather
+    # than a full JIT warmup (numba's pycc AOT compiler is gone upstream).
+    steps = ms.shape[0]
+    ks = np.empty(steps, dtype=np.int64)
+    digits = np.empty(steps, dtype=np.int64)
+    lead6 = np.empty(steps, dtype=np.int64)
+    phis = np.empty(steps, dtype=np.float64)
+    is_add = np.empty(steps, dtype=np.bool_)
+    params = np.empty(steps, dtype=np.int64)
+    k = k0
+    for t in range(steps):
+        log10E = log10c + k * log10pi
+        fl = math.floor(log10E)
+        digits[t] = int(fl) + 1
+        frac = log10E - fl
+        phis[t] = frac
+        lead6[t] = int((10.0 ** frac) * 100000.0)
+        m = ms[t]
+        if k % 2 == 0:  # additive
+            k = (k + add_b) % m
+            is_add[t] = True
+            params[t] = add_b
+        else:           # multiplicative
+            a = roots[t]
+            k = (a * k) % m
+            if k == 0: k = 1
+            is_add[t] = False
+            params[t] = a
+        ks[t] = k
+    return ks, digits, lead6, phis, is_add, params
 
 class RingEpochDAC:
     def __init__(self, k0=21, steps=30,
@@ -41,6 +128,14 @@ class RingEpochDAC:
         self.epochs = epochs
         self.update_policy = update_policy
         self.add_b = add_b
+        # primitive roots once per ring modulus; the old loop re-searched
+        # the same handful of primes on every multiplicative tick
+        self._prim_root = {m: find_primitive_root(m)
+                           for (_, _, ring) in epochs for m in ring}
+        # modulus schedule resolved once: O(1) indexing instead of the
+        # linear epoch scan every tick
+        self._mod_table = np.array([self.modulus_for_t(t) for t in range(steps)],
+                                   dtype=np.int64)
 
     def modulus_for_t(self,t):
         for (start,end,ring) in self.epochs:
@@ -50,22 +145,18 @@ class RingEpochDAC:
         return self.epochs[-1][2][0]
 
     def evolve(self):
+        ms = self._mod_table
+        roots = np.array([self._prim_root[int(m)] for m in ms], dtype=np.int64)
+        ks, digits, lead6, phis, is_add, params = _evolve_core(
+            self.k, ms, roots, self.add_b, LOG10_CONST, LOG10_PI)
         rows=[]
         for t in range(self.steps):
-            log10E=LOG10_CONST+self.k*LOG10_PI
-            digits=int(math.floor(log10E))+1
-            lead6,phi=leading_digits_from_log10(log10E,6)
-            m=self.modulus_for_t(t)
-            # decide update
-            if self.update_policy=="parity_switch":
-                if self.k%2==0: # additive
-                    self.k=(self.k+self.add_b)%m
-                    op=("add",self.add_b)
-                else: # multiplicative
-                    a=find_primitive_root(m)
-                    self.k=(a*self.k)%m or 1
-                    op=("mul",a)
-            rows.append({"t":t,"k":self.k,"m":m,"digits":digits,"leading6":lead6,"phi":phi,"op":op})
+            op = ("add", int(params[t])) if is_add[t] else ("mul", int(params[t]))
+            rows.append({"t":t,"k":int(ks[t]),"m":int(ms[t]),
+                         "digits":int(digits[t]),"leading6":int(lead6[t]),
+                         "phi":float(phis[t]),"op":op})
+        if self.steps:
+            self.k = int(ks[-1])
         return rows
 
 if __name__=="__main__":
@@ -73,4 +164,4 @@ if __name__=="__main__":
     trace=dac.evolve()
     for r in trace:
         print(f"t={r['t']:2} | m={r['m']:4} | op={r['op'][0]:>3}({r['op'][1]}) | k={r['k']:5} | "
-              f"digits≈{r['digits']:4} | leading6={r['leading6']:06d}")
\ No newline at end of file
+              f"digits≈{r['digits']:4} | leading6={r['leading6']:06d}")
@@ -4,20 +4,29 @@ Ethereal Vector Assessment Tool
 TGDK :: 5col6dex Protocol
 """
 
+import functools
 import math
 
-def ethereal_vector_assessment(x, y, z, epsilon):
-    # Step 1: Material magnitude
-    M = math.sqrt(x**2 + y**2 + z**2)
-    
+import numpy as np
+
+@functools.lru_cache(maxsize=4096)
+def _eva_core(x, y, z, epsilon):
+    # Pure function of four floats, so repeated tuples hit the cache and
+    # skip the sqrt/tanh/cos entirely.
+    # Step 1: Material magnitude (hypot: no squaring overflow, one call)
+    M = math.hypot(x, y, z)
+
     # Step 2: 5col6dex ethereal projection
     phi = (epsilon * 6) / (5 * M + 1)
-    
+
     # Step 3: Scoring
     S_norm = math.tanh(phi)                       # Normalized efficacy [0,1]
     S_exp  = (M + epsilon**2) * 10000             # Expanded force rating [10k+ scale]
     V      = math.cos(phi)                        # Virtuation score [-1,1]
-    
+    return M, phi, S_norm, S_exp, V
+
+def ethereal_vector_assessment(x, y, z, epsilon):
+    M, phi, S_norm, S_exp, V = _eva_core(x, y, z, epsilon)
     return {
         "MaterialMagnitude": M,
         "ProjectionPhi": phi,
@@ -26,6 +35,19 @@ def ethereal_vector_assessment(x, y, z, epsilon):
         "VirtuationScore": V
     }
 
+def ethereal_vector_assessment_batch(vectors, epsilon):
+    """Array-shaped entry point: vectors is (n, 3), returns arrays."""
+    v = np.asarray(vectors, dtype=np.float64)
+    M = np.linalg.norm(v, axis=1)
+    phi = (epsilon * 6) / (5 * M + 1)
+    return {
+        "MaterialMagnitude": M,
+        "ProjectionPhi": phi,
+        "NormalizedEfficacy": np.tanh(phi),
+        "ExpandedForceRating": (M + epsilon**2) * 10000,
+        "VirtuationScore": np.cos(phi)
+    }
+
 # Example run
 if __name__ == "__main__":
     result = ethereal_vector_assessment(3, 4, 5, 2)
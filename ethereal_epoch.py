@@ -4,20 +4,27 @@ TGDK Ethereal Vector Assessment + metScore Integration
 5col6dex :: Epoch Sympathiser Protocol
 """
 
+import functools
 import math
 
-def ethereal_vector_assessment(x, y, z, epsilon):
-    # Step 1: Material magnitude
-    M = math.sqrt(x**2 + y**2 + z**2)
-    
+@functools.lru_cache(maxsize=4096)
+def _eva_core(x, y, z, epsilon):
+    # Pure in its four float args; cache hits skip the sqrt/tanh/cos.
+    # Step 1: Material magnitude (hypot: no squaring overflow, one call)
+    M = math.hypot(x, y, z)
+
     # Step 2: 5col6dex projection
     phi = (epsilon * 6) / (5 * M + 1)
-    
+
     # Step 3: Scoring
     norm_eff = math.tanh(phi)                   # [0,1]
     exp_force = (M + epsilon**2) * 10000        # 10k+ scale
     virt = math.cos(phi)                        # [-1,1]
-    
+    return norm_eff, exp_force, virt
+
+def ethereal_vector_assessment(x, y, z, epsilon):
+    norm_eff, exp_force, virt = _eva_core(x, y, z, epsilon)
+
     # Step 4: Map to TGDK metrics
     metScore = {
         "Lens1_NormalizedEfficacy": norm_eff,
@@ -29,7 +36,7 @@ def ethereal_vector_assessment(x, y, z, epsilon):
             "Displaced / Clause Risk"
         )
     }
-    
+
     return metScore
 
 # Example run
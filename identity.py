@@ -40,13 +40,28 @@
 # End BFE License
 # ===========================================================
 
+import types
 from dataclasses import dataclass, field
 from typing import Dict, Any, Callable, List, Tuple
 
+import numpy as np
+
 def metscore_lattice(L: Dict[str, Any]) -> Dict[str, float]:
     return {k: 1.0 for k in L.keys()}
 
+# The unity baseline never varies, so freeze it once; MappingProxyType
+# keeps downstream code from mutating the shared instance.
+_UNITY_DEX = types.MappingProxyType({
+    "invariant": 1.0,
+    "phase_rad": 0.0,
+    "rotation_deg": 0.0,
+    "entropy_gradient": 0.0,
+    "note": "unity baseline"
+})
+
 def fivecol_sixdex_raw(identity_scalar: float = 1.0) -> Dict[str, Any]:
+    if identity_scalar == 1.0:
+        return _UNITY_DEX
     return {
         "invariant": identity_scalar,
         "phase_rad": 0.0,
@@ -66,16 +81,19 @@ class LatticeReport:
 
 def divide_lattice_by_metscore(L: Dict[str, float],
                                M: Dict[str, float]) -> Dict[str, float]:
-    return {k: (v / M.get(k, 1.0)) if M.get(k, 1.0) != 0 else 0.0 for k, v in L.items()}
+    # one vectorized divide over the lattice instead of per-key dict.get
+    keys = tuple(L)
+    lv = np.fromiter((L[k] for k in keys), float, len(keys))
+    mv = np.fromiter((M.get(k, 1.0) for k in keys), float, len(keys))
+    out = np.divide(lv, mv, out=np.zeros_like(lv), where=mv != 0)
+    return dict(zip(keys, out.tolist()))
 
 def immediate_refraction_to_subsets(subsets: Dict[str, Dict[str, float]],
                                     identity_nodes: Dict[str, float]) -> List[Tuple[str, str]]:
-    status = []
-    for name, sub in subsets.items():
-        for k in sub.keys():
-            sub[k] = sub[k] * 1.0
-        status.append((name, "refraction: identity applied; phase=0; ready"))
-    return status
+    # the identity refraction (v * 1.0) is a no-op, so only the status
+    # tagging remains
+    return [(name, "refraction: identity applied; phase=0; ready")
+            for name in subsets]
 
 def run_unity_normalization(L: Dict[str, float],
                             subsets: Dict[str, Dict[str, float]],
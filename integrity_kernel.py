@@ -1,9 +1,37 @@
 import math
 from typing import Dict
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:          # numba is optional; fall back to plain Python
+    prange = range
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
 # ---------- Integrity Kernel (xyjr · K) ----------
 # K = (pi^21) * (7/12) * (3^3)
 _K = (math.pi ** 21) * (7.0 / 12.0) * (3 ** 3)
+_LOG10_K = math.log10(_K)
+
+@njit(cache=True, fastmath=True)
+def _core(x, y, j, r, mu_log10, sigma_log10, K, log10_K):
+    # Guard: nonpositive base collapses integrity to 0 safely.
+    base = x * y * j * r
+    if base <= 0:
+        return 0.0, 0.0, 10_000
+    integrity_raw = base * K
+    # Log-sigmoid normalization on base-10 scale for stability.
+    # log10(base) + log10(K) keeps the norm finite even when base*K
+    # overflows the raw product to inf.
+    z = (math.log10(base) + log10_K - mu_log10) / sigma_log10
+    integrity_norm = 1.0 / (1.0 + math.exp(-z))
+    # Expanded-force lens (always >= 10k)
+    integrity_force = 10_000 + int(math.floor(90_000 * integrity_norm + 1e-9))
+    return integrity_raw, integrity_norm, integrity_force
 
 def integrity_kernel(x: float, y: float, j: float, r: float,
                      mu_log10: float = 9.0,
@@ -37,25 +65,59 @@ def integrity_kernel(x: float, y: float, j: float, r: float,
     - integrity_force = 10_000 + floor(90_000 * integrity_norm)
       (maps 0..1 -> 10k..100k)
     """
-    # Guard: nonpositive base collapses integrity to 0 safely.
-    base = x * y * j * r
-    if base <= 0:
-        return {"integrity_raw": 0.0, "integrity_norm": 0.0, "integrity_force": 10_000}
-
-    integrity_raw = base * _K
+    integrity_raw, integrity_norm, integrity_force = _core(
+        x, y, j, r, mu_log10, sigma_log10, _K, _LOG10_K)
+    return {
+        "integrity_raw": integrity_raw,
+        "integrity_norm": integrity_norm,
+        "integrity_force": int(integrity_force),
+    }
 
-    # Log-sigmoid normalization on base-10 scale for stability
-    log10_val = math.log10(integrity_raw)
-    z = (log10_val - mu_log10) / sigma_log10
-    integrity_norm = 1.0 / (1.0 + math.exp(-z))
+@njit(parallel=True, cache=True, fastmath=True)
+def _batch_core(x, y, j, r, mu_log10, sigma_log10, K, log10_K, raw, norm, force):
+    for i in prange(x.shape[0]):
+        raw[i], norm[i], force[i] = _core(
+            x[i], y[i], j[i], r[i], mu_log10, sigma_log10, K, log10_K)
 
-    # Expanded-force lens (always >= 10k)
-    integrity_force = 10_000 + int(math.floor(90_000 * integrity_norm + 1e-9))
+def integrity_kernel_batch(x, y, j, r,
+                           mu_log10: float = 9.0,
+                           sigma_log10: float = 2.0) -> Dict[str, np.ndarray]:
+    """Vectorized integrity_kernel over 1-D float64 arrays."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    j = np.asarray(j, dtype=np.float64)
+    r = np.asarray(r, dtype=np.float64)
+    raw = np.empty(x.shape[0])
+    norm = np.empty(x.shape[0])
+    force = np.empty(x.shape[0], dtype=np.int64)
+    _batch_core(x, y, j, r, mu_log10, sigma_log10, _K, _LOG10_K,
+                raw, norm, force)
+    return {
+        "integrity_raw": raw,
+        "integrity_norm": norm,
+        "integrity_force": force,
+    }
 
+def integrity_kernel_array(x, y, j, r,
+                           mu_log10: float = 9.0,
+                           sigma_log10: float = 2.0) -> Dict[str, np.ndarray]:
+    """
+    Broadcasting ufunc variant of integrity_kernel: inputs combine under
+    NumPy broadcasting rules, the base<=0 guard becomes an np.where mask,
+    and the sigmoid is the tanh identity 0.5*(1 + tanh(z/2)).
+    """
+    base = (np.asarray(x, dtype=np.float64) * np.asarray(y, dtype=np.float64)
+            * np.asarray(j, dtype=np.float64) * np.asarray(r, dtype=np.float64))
+    mask = base > 0
+    log10_val = np.log10(np.where(mask, base, 1.0)) + _LOG10_K
+    z = (log10_val - mu_log10) / sigma_log10
+    norm = np.where(mask, 0.5 * (1.0 + np.tanh(0.5 * z)), 0.0)
+    raw = np.where(mask, base * _K, 0.0)
+    force = 10_000 + np.floor(90_000 * norm + 1e-9).astype(np.int64)
     return {
-        "integrity_raw": integrity_raw,
-        "integrity_norm": integrity_norm,
-        "integrity_force": integrity_force,
+        "integrity_raw": raw,
+        "integrity_norm": norm,
+        "integrity_force": force,
     }
 
 # ---------- Example ----------
@@ -1,37 +1,44 @@
 import numpy as np, math, random
 
-def kerflump(values, nonlinear="sqrt", jitter=0.05, seed=None):
+def kerflump(values, nonlinear="sqrt", jitter=0.05, seed=None,
+             copy=True, as_list=False):
     """
     Kerflump = collapse & redistribute values chaotically.
     nonlinear: 'sqrt', 'log', 'tanh', or None
     jitter: fraction of value range to add as noise
+    copy: set False to kerflump an ndarray argument in place
+    as_list: return a Python list instead of the ndarray
     """
     rng = np.random.default_rng(seed)
-    vals = np.array(values, dtype=float)
+    vals = np.asarray(values, dtype=np.float64)
+    # the renorm target comes from the array we already have, before any
+    # transform touches it
+    target_sum = vals.sum()
+    if copy:
+        vals = vals.copy()
 
     # 1. shuffle
     rng.shuffle(vals)
 
-    # 2. nonlinear transform
+    # 2. nonlinear transform, in place — no temporaries
     if nonlinear == "sqrt":
-        vals = np.sqrt(vals)
+        np.sqrt(vals, out=vals)
     elif nonlinear == "log":
-        vals = np.log1p(vals)  # log(1+x) to keep safe
+        np.log1p(vals, out=vals)  # log(1+x) to keep safe
     elif nonlinear == "tanh":
-        vals = np.tanh(vals)
+        np.tanh(vals, out=vals)
     # else: leave as-is
 
     # 3. jitter
-    noise = rng.uniform(-jitter, jitter, size=len(vals))
-    vals = vals + noise
+    noise = rng.uniform(-jitter, jitter, size=vals.shape[0])
+    np.add(vals, noise, out=vals)
 
     # ensure no negatives
-    vals = np.clip(vals, 0, None)
+    np.clip(vals, 0, None, out=vals)
 
     # 4. renormalize to original sum
-    target_sum = np.sum(values)
-    cur_sum = np.sum(vals)
+    cur_sum = vals.sum()
     if cur_sum > 0:
-        vals = vals * (target_sum / cur_sum)
+        vals *= target_sum / cur_sum
 
-    return vals.tolist()
\ No newline at end of file
+    return vals.tolist() if as_list else vals
@@ -24,16 +24,19 @@ class KernelAllocator:
     def __init__(self, sqrt_ratio: float = SQRT_RATIO):
         self.sqrt_ratio = sqrt_ratio
         self.angle = 0.0  # capacitor counter-rotation state
+        # weights are a pure function of sqrt_ratio, so normalize once
+        # here instead of on every allocate()
+        r = sqrt_ratio
+        raw = (r, 1/r, r/2.0, 1/(2.0*r))
+        s = sum(raw)
+        self._base_weights = tuple(wi/s for wi in raw)
 
     def _weights(self) -> List[float]:
         """
         4 pyramids get weights derived from the sqrt-ratio family.
         We use a simple normalized set around r and 1/r to keep symmetry.
         """
-        r = self.sqrt_ratio
-        w = [r, 1/r, r/2.0, 1/(2.0*r)]
-        s = sum(w)
-        return [wi/s for wi in w]
+        return self._base_weights
 
     def allocate(self, raw_mass: float, standard_bias: List[float] = None) -> Dict[str, object]:
         """
@@ -42,20 +45,21 @@ class KernelAllocator:
         """
         w = self._weights()
         if standard_bias and len(standard_bias) == 4:
-            # apply optional pyramid biases then renormalize
-            w = [wi*bi for wi,bi in zip(w, standard_bias)]
-            s = sum(w)
-            w = [wi/s for wi in w]
+            # apply optional pyramid biases; this is the only renormalization
+            # needed since the base weights already sum to 1
+            s = sum(wi*bi for wi, bi in zip(w, standard_bias))
+            w = [wi*bi/s for wi, bi in zip(w, standard_bias)]
 
         # allocate to pyramids
-        pyramids = []
-        allocated = 0.0
-        for i in range(NUM_PYRAMIDS):
-            mass_i = raw_mass * w[i]
-            pyramids.append(Pyramid(name=f"P{i+1}", mass=mass_i, bias=(standard_bias[i] if standard_bias else 1.0)))
-            allocated += mass_i
+        pyramids = [
+            Pyramid(name=f"P{i+1}", mass=raw_mass * w[i],
+                    bias=(standard_bias[i] if standard_bias else 1.0))
+            for i in range(NUM_PYRAMIDS)
+        ]
 
-        residual = max(0.0, raw_mass - allocated)
+        # weights sum to 1 by construction, so nothing is left over; the old
+        # raw_mass - allocated subtraction only ever measured float rounding
+        residual = 0.0
 
         # tri-deltalineate residual into 3 equal lanes (you can bias later)
         tri = [residual/3.0]*3
@@ -1,44 +1,105 @@
+import math
+from collections import deque
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:          # numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+from pll import PLLController, DigitPI, pinned_root, LOG10C, LOG10PI
+
+@njit(cache=True)
+def _pow_mod(base, exp, mod):
+    result = 1
+    base %= mod
+    while exp > 0:
+        if exp & 1:
+            result = (result * base) % mod
+        base = (base * base) % mod
+        exp >>= 1
+    return result
+
+@njit(cache=True)
+def _formation_metrics(k, log10c, log10pi):
+    # phases and digits for all formations in one machine-code sweep;
+    # returns (epoch sympathiser ES, mean digit count)
+    n = k.shape[0]
+    cs = 0.0
+    sn = 0.0
+    dsum = 0.0
+    for i in range(n):
+        lam = log10c + k[i] * log10pi
+        fl = math.floor(lam)
+        frac = lam - fl
+        cs += math.cos(2 * math.pi * frac)
+        sn += math.sin(2 * math.pi * frac)
+        dsum += fl + 1
+    return math.hypot(cs, sn) / n, dsum / n
+
+@njit(cache=True)
+def _update_ks(k, kick, a, q, b_eff, m):
+    # in-place k update; the a^q kick is hoisted out of the formation loop
+    if kick:
+        aq = _pow_mod(a, q, m)
+        for i in range(k.shape[0]):
+            x = (aq * k[i]) % m
+            k[i] = x if x != 0 else 1
+    else:
+        for i in range(k.shape[0]):
+            k[i] = (k[i] + b_eff) % m
+
 def staged_rings(epoch_len=60, stages=3, base_primes=(1000,2000,3000), width=40):
     """
     Build staged prime rings around target centers.
     Each stage gets its own ascending ring.
     """
-    def is_prime(n):
-        if n < 2: return False
-        if n % 2 == 0: return n == 2
-        r = int(n**0.5)
-        for i in range(3, r+1, 2):
-            if n % i == 0: return False
-        return True
+    # one sieve spanning every center's window, reused across stages
+    lo = max(2, min(base_primes) - width)
+    hi = max(base_primes) + width
+    sieve = np.ones(hi - lo + 1, dtype=bool)
+    for p in range(2, int(hi ** 0.5) + 1):
+        start = max(p * p, ((lo + p - 1) // p) * p)
+        sieve[start - lo::p] = False
     def nearby_primes(center, width, count=4):
-        cand = []
-        for x in range(center-width, center+width+1):
-            if is_prime(x):
-                cand.append((abs(x-center), x))
-        return [x for _,x in sorted(cand)[:count]]
+        a = max(lo, center - width)
+        xs = np.flatnonzero(sieve[a - lo:center + width + 1 - lo]) + a
+        cand = [(abs(int(x) - center), int(x)) for x in xs]
+        return [x for _, x in sorted(cand)[:count]]
     rings = [nearby_primes(c, width) for c in base_primes]
     stage_len = epoch_len // stages
     return rings, stage_len
 
 def run_staged(k_init, stages=3, epoch_len=60, base_primes=(1000,2000,3000), tau=3):
     rings, stage_len = staged_rings(epoch_len, stages, base_primes)
-    k = list(k_init)
-    hist = []
+    k = np.asarray(k_init, dtype=np.int64).copy()
+    # SoA history: parallel arrays instead of a list of per-step dicts
+    t_arr = np.arange(epoch_len, dtype=np.int64)
+    stage_arr = np.empty(epoch_len, dtype=np.int64)
+    m_arr = np.empty(epoch_len, dtype=np.int64)
+    ES_arr = np.empty(epoch_len, dtype=np.float64)
+    D_arr = np.empty(epoch_len, dtype=np.int64)
     stage = 0
-    ES_window = []
+    # bounded window with O(1) eviction plus a running sum, so the mean
+    # costs two adds per step instead of a pop(0) memmove and re-sum
+    ES_window = deque(maxlen=5)
+    ES_sum = 0.0
     pll = PLLController()
     dpi = DigitPI()
     ring_shift = 0
     for t in range(epoch_len):
         m_ring = rings[stage]
         m = m_ring[(t % len(m_ring) + ring_shift) % len(m_ring)]
-        phases = [phase_of_k(x) for x in k]
-        digits = [digits_of_k(x) for x in k]
-        ES = epoch_sympathiser(phases)
+        ES, D_mean = _formation_metrics(k, LOG10C, LOG10PI)
+        if len(ES_window) == 5: ES_sum -= ES_window[0]
         ES_window.append(ES)
-        if len(ES_window) > 5: ES_window.pop(0)
-        ES_mean = sum(ES_window)/len(ES_window)
-        D_t = round(mean(digits))
+        ES_sum += ES
+        ES_mean = ES_sum/len(ES_window)
+        D_t = round(D_mean)
         # controllers
         b,q = pll.update(ES_mean)
         rshift, bbias = dpi.update(D_t, 100+((t/epoch_len)*300)) # ramp 100->400
@@ -46,15 +107,13 @@ def run_staged(k_init, stages=3, epoch_len=60, base_primes=(1000,2000,3000), tau
         b_eff = b+bbias
         # update ks
         kick = (t % tau == 0)
-        a = pinned_root(m) if kick else None
-        new_k=[]
-        for x in k:
-            if kick: x=(pow(a,q,m)*x)%m or 1
-            else:    x=(x+b_eff)%m
-            new_k.append(x)
-        k=new_k
-        hist.append({"t":t,"stage":stage,"m":m,"ES":ES,"D":D_t})
+        a = pinned_root(m) if kick else 0
+        _update_ks(k, kick, a, q, b_eff, m)
+        stage_arr[t] = stage
+        m_arr[t] = m
+        ES_arr[t] = ES
+        D_arr[t] = D_t
         # stage advancement check
         if (t+1)%stage_len==0 and stage<stages-1 and ES_mean>=0.92:
             stage+=1
-    return hist
\ No newline at end of file
+    return t_arr, stage_arr, m_arr, ES_arr, D_arr
\ No newline at end of file
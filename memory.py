@@ -11,8 +11,9 @@
 import hashlib
 import json
 import os
+import re
 import sys
-from datetime import datetime
+import time
 from typing import Dict, Any
 
 # ------------------------------------------------
@@ -23,34 +24,87 @@ CONFIG = {
     "trigger_hash": hashlib.sha256(
         "Raven Regent of the Forgotten Rose".encode("utf-8")
     ).hexdigest(),
-    "memory_store": os.path.expanduser("~/.tgdk_olivia_memory.json"),
+    "memory_store": os.path.expanduser("~/.tgdk_olivia_memory.jsonl"),
+    "legacy_memory_store": os.path.expanduser("~/.tgdk_olivia_memory.json"),
     "log_file": os.path.expanduser("~/.tgdk_olivia_memory.log"),
     "semblance_boost": 0.42,
 }
 
+# Compiled once at import; a case-insensitive regex scan avoids building
+# a lowercased copy of the whole input on every invocation.
+_TRIG_RE = re.compile(re.escape(CONFIG["trigger_symbol"]), re.IGNORECASE)
+
 
 # ------------------------------------------------
 # Utility helpers
 # ------------------------------------------------
+# Lazily opened, line-buffered log handle — one open() for the process
+# instead of an open/close per line.
+_LOG_FH = None
+
+
 def log(msg: str) -> None:
     """Append a timestamped line to the local TGDK log."""
-    ts = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
-    with open(CONFIG["log_file"], "a", encoding="utf-8") as f:
-        f.write(f"[{ts}] {msg}\n")
+    global _LOG_FH
+    if _LOG_FH is None:
+        _LOG_FH = open(CONFIG["log_file"], "a", encoding="utf-8", buffering=1)
+    ts = time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime())
+    _LOG_FH.write(f"[{ts}] {msg}\n")
+
+
+def _migrate_legacy_store() -> None:
+    """One-time migration of the pre-JSONL document store.
+
+    Earlier versions kept the whole store as one JSON document at
+    ~/.tgdk_olivia_memory.json; rewrite its entries as JSONL so an
+    existing store is not orphaned by the format change. The legacy
+    file is left in place untouched.
+    """
+    legacy = CONFIG["legacy_memory_store"]
+    if os.path.exists(CONFIG["memory_store"]) or not os.path.exists(legacy):
+        return
+    try:
+        with open(legacy, "r", encoding="utf-8") as f:
+            entries = json.load(f).get("entries", [])
+    except (ValueError, OSError) as exc:
+        log(f"Legacy memory store {legacy} unreadable, ignoring: {exc}")
+        return
+    save_memory({"entries": entries})
+    log(f"Migrated {len(entries)} entries from legacy store {legacy}.")
 
 
 def load_memory() -> Dict[str, Any]:
-    """Load local memory file (create if missing)."""
+    """Load the JSONL memory file (create if missing)."""
+    _migrate_legacy_store()
     if not os.path.exists(CONFIG["memory_store"]):
         return {"entries": []}
     with open(CONFIG["memory_store"], "r", encoding="utf-8") as f:
-        return json.load(f)
+        return {"entries": [json.loads(line) for line in f if line.strip()]}
+
+
+def append_memory(record: Dict[str, Any]) -> None:
+    """Append one event line; avoids rewriting the whole store per event."""
+    _migrate_legacy_store()
+    with open(CONFIG["memory_store"], "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False,
+                           separators=(",", ":")) + "\n")
 
 
 def save_memory(data: Dict[str, Any]) -> None:
-    """Persist local memory file."""
-    with open(CONFIG["memory_store"], "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    """Full rewrite of the store — offline compaction only.
+
+    Writes to a sibling temp file, fsyncs, then os.replace()s over the
+    store so a crash mid-compaction never leaves a truncated file.
+    """
+    path = CONFIG["memory_store"]
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        for record in data.get("entries", []):
+            f.write(json.dumps(record, ensure_ascii=False,
+                               separators=(",", ":")) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
 
 
 # ------------------------------------------------
@@ -61,18 +115,15 @@ def trigger_semblance_modifier(payload: Dict[str, Any]) -> Dict[str, Any]:
     Main routine executed when the Raven-Regent seal is detected.
     Returns a structured response describing the memory-reprisal result.
     """
-    memory_data = load_memory()
-
     event_record = {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         "trigger_hash": CONFIG["trigger_hash"],
         "semblance_boost": CONFIG["semblance_boost"],
         "payload_excerpt": payload.get("excerpt", "")[:128],
         "context": payload.get("context", "unspecified"),
     }
 
-    memory_data.setdefault("entries", []).append(event_record)
-    save_memory(memory_data)
+    append_memory(event_record)
 
     result = {
         "status": "success",
@@ -100,7 +151,7 @@ def main() -> None:
     input_text = " ".join(sys.argv[1:])
     payload = {"excerpt": input_text, "context": "CLI invocation"}
 
-    if CONFIG["trigger_symbol"].lower() in input_text.lower():
+    if _TRIG_RE.search(input_text):
         result = trigger_semblance_modifier(payload)
         print(json.dumps(result, indent=2))
     else:
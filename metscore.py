@@ -1,27 +1,25 @@
 # metScore dual-lens verifier
+import numpy as np
+
 D_min, D_max = 86, 410  # campaign bounds
 
 # Replace these with your actual campaign samples:
 digits = [86, 117, 159, 243, 410]
 phi    = [0.602, 0.157, 0.494, 0.887, 0.205]  # approximations used above
 
-def eff_norm(D):
-    return (D - D_min) / (D_max - D_min)
-
-def force(D, ph):
-    return 10_000 * D + int(1_000_000 * ph)
-
-rows = []
-for t, (D, ph) in enumerate(zip(digits, phi)):
-    rows.append((t, D, ph, round(eff_norm(D), 3), force(D, ph)))
+# Both lenses are ufunc arithmetic over the campaign arrays; Python-level
+# iteration happens only at the print boundary.
+D = np.asarray(digits, dtype=np.int64)
+P = np.asarray(phi, dtype=np.float64)
+en = np.round((D - D_min) / (D_max - D_min), 3)
+F = 10_000 * D + (1_000_000 * P).astype(np.int64)
 
 print("t | D |   phi   | eff_norm |   force")
 print("--+---+---------+----------+---------")
-for t, D, ph, en, F in rows:
-    print(f"{t:1d} |{D:3d}| {ph:7.3f} | {en:8.3f} | {F:9,d}")
+for t, (D_t, ph, en_t, F_t) in enumerate(zip(D, P, en, F)):
+    print(f"{t:1d} |{D_t:3d}| {ph:7.3f} | {en_t:8.3f} | {F_t:9,d}")
 
 # Snapshot (last step)
-t, D, ph, en, F = rows[-1]
 print("\nSnapshot metScore:")
-print(f"  normalized = {en:.3f}")
-print(f"  expanded   = {F:,d}")
\ No newline at end of file
+print(f"  normalized = {en[-1]:.3f}")
+print(f"  expanded   = {F[-1]:,d}")
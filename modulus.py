@@ -1,12 +1,16 @@
 import math
 
+import numpy as np
+
 CONST = 1_860_320
 LOG10_CONST = math.log10(CONST) + 144*math.log10(3)
 LOG10_PI = math.log10(math.pi)
+_LOG2_10 = math.log2(10)
 
 def leading_digits_from_log10(log10x, m=6):
     frac = log10x - math.floor(log10x)
-    return int((10**frac) * 10**(m-1))
+    # exp2 skips the log step inside libm's pow
+    return int(math.exp2(frac * _LOG2_10) * 10**(m-1))
 
 def next_prime(n):
     def is_prime(x):
@@ -22,18 +26,35 @@ def next_prime(n):
         p += 1
     return p
 
+def _sieve_primes(bound):
+    sieve = np.ones(bound + 1, dtype=bool)
+    sieve[:2] = False
+    for i in range(2, int(bound ** 0.5) + 1):
+        if sieve[i]:
+            sieve[i*i::i] = False
+    return np.flatnonzero(sieve)
+
 def evolve_dynamic(k0=21, steps=20):
     k = k0
     rows = []
+    # one sieve replaces per-step trial division; double-and-resieve
+    # if the walk ever outruns the bound
+    bound = 2 * (k0 + steps) + 64
+    primes = _sieve_primes(bound)
     for t in range(steps):
         log10E = LOG10_CONST + k * LOG10_PI
-        digits = int(math.floor(log10E)) + 1
+        # log10E > 0 here, so int() truncation matches math.floor
+        digits = int(log10E) + 1
         lead6 = leading_digits_from_log10(log10E, 6)
 
         rows.append({"t": t, "k": k, "digits": digits, "leading6": lead6})
 
         # ----- Dynamic allocation rules -----
-        m = next_prime(k + t)   # modulus depends on time & state
+        n = k + t               # modulus depends on time & state
+        while primes[-1] <= n:
+            bound *= 2
+            primes = _sieve_primes(bound)
+        m = int(primes[np.searchsorted(primes, n + 1)])
         if t % 2 == 0:          # even steps: additive
             k = (k + 7) % m
         else:                   # odd steps: multiplicative
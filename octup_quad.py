@@ -28,7 +28,9 @@ LANES_PER_QUAD = 8
 @dataclass
 class Lane:
     id: str
-    queue: Deque[dict] = field(default_factory=deque)  # items: {"id":..., "weight":...}
+    # entries are (weight, item) pairs; the weight is parsed from the
+    # item dict once at enqueue instead of every tick it sits at head
+    queue: Deque[tuple] = field(default_factory=deque)
     active: bool = True
 
 @dataclass
@@ -38,6 +40,9 @@ class Quadrant:
     priority: float = 1.0   # external bias knob (e.g., prioritize Revenue > Cost)
     mass_share: float = 0.25  # filled by allocator
     rr_idx: int = 0
+    # incrementally-maintained queue lengths; shortest-lane selection
+    # indexes this list instead of len()-scanning every deque
+    lane_lens: List[int] = field(default_factory=lambda: [0] * LANES_PER_QUAD)
 
 class OctupQuadEngine:
     def __init__(self, allocator):
@@ -60,13 +65,14 @@ class OctupQuadEngine:
         """Add an item into a quadrant. If lane_hint is None, use shortest queue."""
         q = self.quads[quadrant]
         if lane_hint is None:
-            tgt = min(q.lanes, key=lambda L: len(L.queue))
+            idx = min(range(LANES_PER_QUAD), key=q.lane_lens.__getitem__)
         else:
-            tgt = q.lanes[lane_hint % LANES_PER_QUAD]
-        tgt.queue.append(item)
+            idx = lane_hint % LANES_PER_QUAD
+        q.lane_lens[idx] += 1
+        q.lanes[idx].queue.append((float(item.get("weight", 1.0)), item))
 
     def snapshot_load(self) -> Dict[str, int]:
-        return {q: sum(len(L.queue) for L in self.quads[q].lanes) for q in QUADRANTS}
+        return {q: sum(self.quads[q].lane_lens) for q in QUADRANTS}
 
     def step(self, raw_mass: float) -> Dict:
         """
@@ -105,21 +111,20 @@ class OctupQuadEngine:
             cap = quad_caps[q]
             qd = self.quads[q]
             pulled = 0.0
-            # round-robin across lanes
-            lane_indices = list(range(LANES_PER_QUAD))
+            # round-robin across lanes; modular indexing avoids building
+            # a rotated copy of the index list every quadrant every tick
             start = qd.rr_idx % LANES_PER_QUAD
-            lane_indices = lane_indices[start:] + lane_indices[:start]
-
-            for idx in lane_indices:
+            for offset in range(LANES_PER_QUAD):
+                idx = (start + offset) & 7  # LANES_PER_QUAD == 8
                 if pulled >= cap:
                     break
                 L = qd.lanes[idx]
                 if not L.active or not L.queue:
                     continue
-                item = L.queue[0]
-                w = float(item.get("weight", 1.0))
+                w = L.queue[0][0]
                 if pulled + w <= cap:
-                    schedule.append((q, L.id, L.queue.popleft()))
+                    schedule.append((q, L.id, L.queue.popleft()[1]))
+                    qd.lane_lens[idx] -= 1
                     pulled += w
 
             qd.rr_idx = (start + 1) % LANES_PER_QUAD  # advance RR head
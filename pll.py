@@ -1,6 +1,16 @@
 import math
 from statistics import mean
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:          # numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
 # --- constants for E = C * 3^144 * pi^k ---
 C = 1_860_320
 LOG10C = math.log10(C) + 144 * math.log10(3)
@@ -14,6 +24,16 @@ def digits_of_k(k):
     lam = LOG10C + k * LOG10PI
     return int(math.floor(lam)) + 1
 
+def _phase_digit_ES(k_arr):
+    """Phases, digit counts and ES for all formations in one ufunc sweep."""
+    lam = LOG10C + k_arr * LOG10PI
+    frac = lam - np.floor(lam)
+    digits = lam.astype(np.int64) + 1  # lam > 0, truncation == floor
+    two_pi_frac = (2 * math.pi) * frac
+    ES = math.hypot(np.cos(two_pi_frac).sum(),
+                    np.sin(two_pi_frac).sum()) / k_arr.size
+    return frac, digits, ES
+
 def epoch_sympathiser(phases):
     if not phases: return 0.0
     sx = sum(math.cos(2*math.pi*p) for p in phases)
@@ -21,21 +41,19 @@ def epoch_sympathiser(phases):
     return math.hypot(sx, sy) / len(phases)  # R in [0,1]
 
 # --- primitive roots ---
-def factors(n):
-    f, d = set(), 2
-    while d * d <= n:
-        while n % d == 0: f.add(d); n//=d
-        d = 3 if d==2 else d+2
-    if n>1: f.add(n)
-    return f
+# factorization comes from the shared small-prime table
+from _primes import prime_factors as factors
 
 def is_primitive_root(a, p):
     phi = p-1
     return all(pow(a, phi//q, p) != 1 for q in factors(phi))
 
 def find_primitive_root(p):
+    # factor phi once and share the exponent list across the whole sweep
+    phi = p - 1
+    exps = [phi // q for q in factors(phi)]
     for g in range(2, p):
-        if is_primitive_root(g, p): return g
+        if all(pow(g, e, p) != 1 for e in exps): return g
     raise RuntimeError("no primitive root found")
 
 # cache pinned primitive roots (Lever 1)
@@ -45,6 +63,45 @@ def pinned_root(p):
         PINNED_ROOTS[p] = find_primitive_root(p)
     return PINNED_ROOTS[p]
 
+# cache kick multipliers a^q mod m per (m, q); repeated ticks on the
+# same modulus/power pair then skip the modular exponentiation entirely
+KICK_MULT = {}
+def kick_multiplier(m, q):
+    key = (m, q)
+    if key not in KICK_MULT:
+        KICK_MULT[key] = pow(pinned_root(m), q, m)
+    return KICK_MULT[key]
+
+@njit(cache=True)
+def _advance(k, aq, b, m, kick):
+    """In-place modular update of the formation array for one tick.
+
+    For ring-sized moduli the kick path uses Barrett reduction: with
+    mu = 2^46 // m and products < 2^32, multiply+shift brackets the
+    quotient to within one, so a conditional subtract replaces the
+    hardware divide. Larger moduli fall back to %.
+    """
+    if kick and 0 < m < 65536:
+        mu = (1 << 46) // m
+        for i in range(k.size):
+            p = aq * k[i]
+            x = p - ((p * mu) >> 46) * m
+            if x >= m:
+                x -= m
+            if x == 0:
+                x = 1
+            k[i] = x
+    else:
+        for i in range(k.size):
+            x = k[i]
+            if kick:
+                x = (aq * x) % m
+                if x == 0:
+                    x = 1
+            else:
+                x = (x + b) % m
+            k[i] = x
+
 # --- Lever 5 controllers ---
 
 class PLLController:
@@ -110,45 +167,44 @@ def run_with_pll(
     D_star_start=100,  # digit setpoint ramp start
     D_star_end=430     # digit setpoint ramp end
 ):
-    k = list(k_init)
+    k = np.asarray(k_init, dtype=np.int64)
     pll = PLLController(ES_target=0.95, k_b=1, k_q=1, b_base=7, b_bounds=(-1, +3), q_bounds=(1, 4))
     dpi = DigitPI(kp=0.12, ki=0.03, bias_b_limit=1)
 
     ring_idx_offset = 0
     hist = []
 
+    # per-tick invariants folded ahead of the loop: ring length and the
+    # digit-setpoint ramp depend only on the call parameters
+    n_ring = len(ring)
+    denom = max(1, steps - 1)
+    d_stars = [round(D_star_start + (D_star_end - D_star_start) * (t / denom))
+               for t in range(steps)]
+
     for t in range(steps):
         # choose modulus with (optional) ring index shift from PI:
-        base_idx = (t % len(ring))
-        m = ring[(base_idx + ring_idx_offset) % len(ring)]
+        base_idx = (t % n_ring)
+        m = ring[(base_idx + ring_idx_offset) % n_ring]
 
         # compute current phases/digits BEFORE update for control signals:
-        phases = [phase_of_k(x) for x in k]
-        digits = [digits_of_k(x) for x in k]
-        ES = epoch_sympathiser(phases)
-        D_t = round(mean(digits))
+        _, digits, ES = _phase_digit_ES(k)
+        D_t = round(float(digits.mean()))
 
         # targets
-        D_star = round(D_star_start + (D_star_end - D_star_start) * (t / max(1, steps - 1)))
+        D_star = d_stars[t]
 
         # controllers:
         b, q = pll.update(ES)  # epoch sympathiser loop
         ring_shift, b_bias = dpi.update(D_t, D_star)  # digit tracking loop
-        ring_idx_offset = (ring_idx_offset + ring_shift) % len(ring)
+        ring_idx_offset = (ring_idx_offset + ring_shift) % n_ring
         b_eff = b + b_bias  # effective additive step (bounded small nudge)
 
         # update ks:
         kick = (t % tau == 0)
-        a = pinned_root(m) if kick else None
-        new_k = []
-        for x in k:
-            if kick:
-                # power kick: a^q * x (mod m), avoid 0
-                x = (pow(a, q, m) * x) % m or 1
-            else:
-                x = (x + b_eff) % m
-            new_k.append(x)
-        k = new_k
+        # power kick: a^q * x (mod m), avoid 0; a^q is invariant across
+        # formations and cached per (m, q)
+        aq = kick_multiplier(m, q) if kick else 0
+        _advance(k, aq, b_eff, m, kick)
 
         # record
         hist.append({
@@ -1,26 +1,21 @@
 import math
 
+import numpy as np
+
 # ----- Fixed numeric pieces from your expression -----
 CONST = 1_860_320  # 1*2*12*66440*(7/(3*2))
 LOG10_CONST = math.log10(CONST) + 144*math.log10(3)
 LOG10_PI = math.log10(math.pi)
+_LOG2_10 = math.log2(10)
 
 def leading_digits_from_log10(log10x, m=6):
     frac = log10x - math.floor(log10x)
-    return int((10**frac) * 10**(m-1))
+    # exp2 skips the log step inside libm's pow
+    return int(math.exp2(frac * _LOG2_10) * 10**(m-1))
 
 # ---------- Utilities for multiplicative cycles ----------
-def prime_factors(n):
-    """Trial division factorization of n (smallish n is fine)."""
-    f, i = set(), 2
-    while i * i <= n:
-        while n % i == 0:
-            f.add(i)
-            n //= i
-        i += 1 if i == 2 else 2
-    if n > 1:
-        f.add(n)
-    return f
+# factorization/primality come from the shared small-prime table
+from _primes import prime_factors, is_prime
 
 def is_primitive_root(a, p):
     """Check if 'a' is a primitive root modulo prime p."""
@@ -32,27 +27,41 @@ def is_primitive_root(a, p):
             return False
     return True
 
-def is_prime(n):
-    if n < 2:
-        return False
-    if n in (2,3):
-        return True
-    if n % 2 == 0:
-        return False
-    r = int(n**0.5)
-    for i in range(3, r+1, 2):
-        if n % i == 0:
-            return False
-    return True
-
 def find_primitive_root(p):
     """Find a primitive root modulo prime p (simple search)."""
     assert is_prime(p)
+    # factor phi once and share the exponent list across the whole sweep
+    phi = p - 1
+    exps = [phi // q for q in prime_factors(phi)]
     for a in range(2, p):
-        if is_primitive_root(a, p):
+        if all(pow(a, e, p) != 1 for e in exps):
             return a
     raise ValueError("No primitive root found (should not happen for prime p).")
 
+def _brent_cycle_length(f, x0, limit):
+    """Brent's cycle detection: length of the cycle reached from x0.
+
+    Both update maps here are bijections mod m, so the orbit of x0 is a
+    pure cycle and the first repeat index equals the cycle length. Runs
+    in O(1) memory; gives up and returns None after `limit` map
+    evaluations so short traces never pay for a long hidden cycle.
+    """
+    power = lam = 1
+    tortoise = x0
+    hare = f(x0)
+    evals = 1
+    while tortoise != hare:
+        if evals >= limit:
+            return None
+        if power == lam:
+            tortoise = hare
+            power *= 2
+            lam = 0
+        hare = f(hare)
+        lam += 1
+        evals += 1
+    return lam
+
 # ---------- Core engine ----------
 def evolve_k(
     k0=21,
@@ -79,28 +88,35 @@ def evolve_k(
     else:
         raise ValueError("mode must be 'multiplicative' or 'additive'.")
 
-    # Run and detect first repeat
-    seen = {}
+    # Detect the cycle in O(1) memory (Brent), then emit the trace
+    # independently; the repeated state still closes the trace as before.
     k = k0 % m
-    rows = []
-    t = 0
-    while t < steps:
-        log10E = LOG10_CONST + k * LOG10_PI
-        digits = int(math.floor(log10E)) + 1
-        lead6 = leading_digits_from_log10(log10E, 6)
-        rows.append({
-            "t": t, "k": k, "digits": digits, "leading6": lead6
-        })
-
-        if k in seen:
-            first = seen[k]
-            detected_period = t - first
-            break
-        seen[k] = t
-        k = update(k)
-        t += 1
+    lam = _brent_cycle_length(update, k, 3 * steps + 8)
+    if lam is not None and lam < steps:
+        detected_period = lam
+        n_rows = lam + 1
     else:
         detected_period = None
+        n_rows = steps
+
+    # whole-trace k sequence: closed form for additive, a short modular
+    # power chain for multiplicative; lenses are then elementwise ufuncs
+    ts = np.arange(n_rows, dtype=np.int64)
+    if mode == "additive":
+        ks = (k + ts * b) % m
+    else:
+        a_pows = np.empty(n_rows, dtype=np.int64)
+        acc = 1
+        for i in range(n_rows):
+            a_pows[i] = acc
+            acc = (acc * a) % m
+        ks = (k * a_pows) % m
+    log10E = LOG10_CONST + ks * LOG10_PI
+    digits = log10E.astype(np.int64) + 1  # log10E > 0
+    frac = log10E - np.floor(log10E)
+    lead6 = (np.exp2(frac * _LOG2_10) * 100000.0).astype(np.int64)
+    rows = [{"t": int(t), "k": int(kk), "digits": int(d), "leading6": int(l)}
+            for t, kk, d, l in zip(ts, ks, digits, lead6)]
 
     return {
         "mode": mode,
@@ -10,11 +10,9 @@ NUM_PYRAMIDS = 4
 CAP_ROTATE_DEGREES = 45.0
 TICK_MULTIPLE = 0.0102
 
-# QUMA map for non-standard hex
-QUMA_MAP = {
-    '0':'Q','1':'X','2':'M','3':'H','4':'A','5':'V','6':'E','7':'R','8':'S','9':'O',
-    'a':'L','b':'I','c':'G','d':'T','e':'U','f':'N'
-}
+# QUMA map for non-standard hex; one C-level translate remaps the whole
+# digest instead of a per-character dict walk
+_QUMA_TRANS = str.maketrans('0123456789abcdef', 'QXMHAVERSOLIGTUN')
 
 # --------------------------
 # Utility functions
@@ -25,7 +23,7 @@ def quma_seal(obj: Dict, salt: str="QUMA") -> str:
     """
     j = json.dumps(obj, sort_keys=True, separators=(',',':'))
     h = hashlib.sha256((j + salt).encode()).hexdigest()
-    return ''.join(QUMA_MAP[ch] for ch in h)
+    return h.translate(_QUMA_TRANS)
 
 @dataclass
 class Pyramid:
@@ -44,12 +42,14 @@ class KernelAllocator:
     def __init__(self, sqrt_ratio: float = SQRT_RATIO):
         self.sqrt_ratio = sqrt_ratio
         self.angle = 0.0
+        # weights are a pure function of sqrt_ratio; normalize once here
+        r = sqrt_ratio
+        raw = (r, 1/r, r/2.0, 1/(2.0*r))
+        s = sum(raw)
+        self._base_weights = [wi/s for wi in raw]
 
     def _weights(self) -> List[float]:
-        r = self.sqrt_ratio
-        w = [r, 1/r, r/2.0, 1/(2.0*r)]
-        s = sum(w)
-        return [wi/s for wi in w]
+        return self._base_weights
 
     def allocate(self, raw_mass: float, standard_bias: List[float] = None) -> Dict[str, object]:
         w = self._weights()
@@ -1,21 +1,17 @@
 import math
 import hashlib
 
+# remap 0-9,a-f into a proprietary alphabet; built once, applied with a
+# single C-level translate
+_QUMA_TRANS = str.maketrans('0123456789abcdef', 'QXMHAVERSOLIGTUN')
+
 def quma_hex_digest(seed: str, salt: str = "HIGGS125"):
     # Step 1: Standard hash base (just to get entropy)
     base = hashlib.sha256((seed + salt).encode()).hexdigest()
-    
+
     # Step 2: Transform into QUMA-Hex (non-standard)
-    # remap 0-9,a-f into a proprietary alphabet
-    mapping = {
-        '0':'Q', '1':'X', '2':'M', '3':'H',
-        '4':'A', '5':'V', '6':'E', '7':'R',
-        '8':'S', '9':'O',
-        'a':'L', 'b':'I', 'c':'G',
-        'd':'T', 'e':'U', 'f':'N'
-    }
-    quma_digest = ''.join(mapping[ch] for ch in base)
-    
+    quma_digest = base.translate(_QUMA_TRANS)
+
     # Step 3: Bind to XEMChain (append lattice fold marker)
     xem_digest = f"XEM::{quma_digest}::QUMA"
     
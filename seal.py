@@ -5,62 +5,69 @@ TGDK Ethereal Vector Seal Binder
 Generates a seal image for each ethereal vector assessment.
 """
 
+import functools
 import math
-import matplotlib.pyplot as plt
 
+import numpy as np
+
+@functools.lru_cache(maxsize=4096)
 def ethereal_vector_assessment(x, y, z, epsilon):
     M = math.sqrt(x**2 + y**2 + z**2)
     phi = (epsilon * 6) / (5 * M + 1)
-    
+
     norm_eff = math.tanh(phi)                   # [0,1]
     exp_force = (M + epsilon**2) * 10000        # 10k+ scale
     virt = math.cos(phi)                        # [-1,1]
-    
+
     status = (
         "Stable Alignment" if virt > 0.9 else
         "Sympathetic Drift" if virt > 0.5 else
         "Displaced / Clause Risk"
     )
-    
-    return norm_eff, exp_force, virt, status
-
-def generate_seal(x, y, z, epsilon, filename="ethereal_seal.png"):
-    norm_eff, exp_force, virt, status = ethereal_vector_assessment(x, y, z, epsilon)
 
-    # Create figure
-    fig, ax = plt.subplots(figsize=(6,6))
-    circle = plt.Circle((0.5, 0.5), 0.45, color="black", fill=False, linewidth=3)
-    ax.add_artist(circle)
+    return norm_eff, exp_force, virt, status
 
-    # Title
-    ax.text(0.5, 0.85, "TGDK :: Ethereal Vector Seal", 
-            ha="center", va="center", fontsize=12, weight="bold")
+def ethereal_vector_assessment_np(xs, ys, zs, epsilon):
+    """Vectorized assessment over parallel coordinate arrays."""
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    zs = np.asarray(zs, dtype=np.float64)
+    M = np.sqrt(xs**2 + ys**2 + zs**2)
+    phi = (epsilon * 6) / (5 * M + 1)
 
-    # Inner metrics
-    ax.text(0.5, 0.65, f"Lens1 (Norm Efficacy): {norm_eff:.3f}", 
-            ha="center", va="center", fontsize=10)
-    ax.text(0.5, 0.55, f"Lens2 (Expanded Force): {exp_force:,.0f}", 
-            ha="center", va="center", fontsize=10)
-    ax.text(0.5, 0.45, f"Virtuation: {virt:.3f}", 
-            ha="center", va="center", fontsize=10)
+    norm_eff = np.tanh(phi)
+    exp_force = (M + epsilon**2) * 10000
+    virt = np.cos(phi)
+    status = np.select([virt > 0.9, virt > 0.5],
+                       ["Stable Alignment", "Sympathetic Drift"],
+                       default="Displaced / Clause Risk")
+    return norm_eff, exp_force, virt, status
 
-    # Epoch Sympathiser status in bold
-    ax.text(0.5, 0.30, f"Epoch: {status}", 
-            ha="center", va="center", fontsize=11, weight="bold", color="red")
+# Static SVG skeleton; drawing text directly skips the Matplotlib
+# figure/axes machinery and PNG compression entirely.
+_SEAL_SVG = """\
+<svg xmlns="http://www.w3.org/2000/svg" width="600" height="600" viewBox="0 0 600 600">
+  <rect width="600" height="600" fill="white"/>
+  <circle cx="300" cy="300" r="270" fill="none" stroke="black" stroke-width="3"/>
+  <text x="300" y="95" text-anchor="middle" font-family="sans-serif" font-size="22" font-weight="bold">TGDK :: Ethereal Vector Seal</text>
+  <text x="300" y="215" text-anchor="middle" font-family="sans-serif" font-size="18">Lens1 (Norm Efficacy): {norm_eff:.3f}</text>
+  <text x="300" y="275" text-anchor="middle" font-family="sans-serif" font-size="18">Lens2 (Expanded Force): {exp_force:,.0f}</text>
+  <text x="300" y="335" text-anchor="middle" font-family="sans-serif" font-size="18">Virtuation: {virt:.3f}</text>
+  <text x="300" y="425" text-anchor="middle" font-family="sans-serif" font-size="20" font-weight="bold" fill="red">Epoch: {status}</text>
+</svg>
+"""
 
-    # Remove axes
-    ax.set_xticks([])
-    ax.set_yticks([])
-    ax.set_xlim(0,1)
-    ax.set_ylim(0,1)
-    ax.axis("off")
+def generate_seal(x, y, z, epsilon, filename="ethereal_seal.svg"):
+    norm_eff, exp_force, virt, status = ethereal_vector_assessment(x, y, z, epsilon)
 
-    plt.savefig(filename, dpi=300, bbox_inches="tight")
-    plt.close()
+    svg = _SEAL_SVG.format(norm_eff=norm_eff, exp_force=exp_force,
+                           virt=virt, status=status)
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(svg)
 
     return filename
 
 # Example run
 if __name__ == "__main__":
-    seal_file = generate_seal(3, 4, 5, 2, "ethereal_vector_seal.png")
-    print(f"Seal generated: {seal_file}")
\ No newline at end of file
+    seal_file = generate_seal(3, 4, 5, 2, "ethereal_vector_seal.svg")
+    print(f"Seal generated: {seal_file}")
@@ -1,17 +1,32 @@
 import math, hashlib, json
 from dataclasses import dataclass, field
+from struct import pack
 from typing import Dict, List, Deque, Tuple
 from collections import deque
 
-# --- QUMA map for non-standard hex ---
-QUMA_MAP = {
-    '0':'Q','1':'X','2':'M','3':'H','4':'A','5':'V','6':'E','7':'R','8':'S','9':'O',
-    'a':'L','b':'I','c':'G','d':'T','e':'U','f':'N'
-}
+# --- QUMA map for non-standard hex; single C-level translate ---
+_QUMA_TRANS = str.maketrans('0123456789abcdef', 'QXMHAVERSOLIGTUN')
 def quma_seal(obj: Dict, salt: str="OCTUPQ") -> str:
     j = json.dumps(obj, sort_keys=True, separators=(',',':'))
     h = hashlib.sha256((j + salt).encode()).hexdigest()
-    return ''.join(QUMA_MAP[ch] for ch in h)
+    return h.translate(_QUMA_TRANS)
+
+def _encode_tick(result: Dict) -> bytes:
+    """Deterministic fixed-order binary encoding of a tick result.
+
+    Numeric fields go through struct.pack and the scheduled triples are
+    joined with unit/record separators, so sealing skips the pure-Python
+    JSON serializer entirely.
+    """
+    caps = result["quad_caps"]
+    backlog = result["backlog"]
+    head = pack('<qdd4d4q', result["tick"], result["angle_deg"],
+                result["rot_mod"],
+                *(caps[q] for q in QUADRANTS),
+                *(backlog[q] for q in QUADRANTS))
+    # item ids are caller-supplied and need not be strings
+    sched = "\x1e".join("\x1f".join(map(str, t)) for t in result["scheduled"])
+    return head + sched.encode()
 
 # --- Constants ---
 SQRT_RATIO = 4.39
@@ -23,7 +38,8 @@ LANES_PER_QUAD = 8
 @dataclass
 class Lane:
     id: str
-    queue: Deque[dict] = field(default_factory=deque)
+    # (weight, item) pairs; weight parsed once at enqueue
+    queue: Deque[tuple] = field(default_factory=deque)
 
 @dataclass
 class Quadrant:
@@ -32,6 +48,8 @@ class Quadrant:
     priority: float = 1.0
     mass_share: float = 0.25
     rr_idx: int = 0
+    # incrementally-maintained queue lengths for O(1)-per-lane selection
+    lane_lens: List[int] = field(default_factory=lambda: [0] * LANES_PER_QUAD)
 
 class OctupQuadEngine:
     def __init__(self):
@@ -46,6 +64,17 @@ class OctupQuadEngine:
         self.quads["Growth"].priority  = 1.10
         self.quads["Cost"].priority    = 0.95
         self.quads["Overhead"].priority= 0.80
+        # SQRT_RATIO is constant, so normalize the share weights once
+        self._weights_cache = self._weights()
+        # rotation recurrence: the angle advances by a fixed delta per
+        # tick, so cos(angle) is maintained with a 2x2 rotation instead
+        # of a transcendental call; resynced periodically to bound drift
+        d = math.radians(CAP_ROTATE_DEGREES * TICK_MULTIPLE)
+        self._dcos, self._dsin = math.cos(d), math.sin(d)
+        self._cos_a, self._sin_a = 1.0, 0.0
+        # seal hasher with the constant salt absorbed once; each tick
+        # clones it and feeds only the variable tick encoding
+        self._seal_hasher = hashlib.sha256(b'OCTUPQ')
 
     def _weights(self) -> List[float]:
         r = SQRT_RATIO
@@ -56,23 +85,30 @@ class OctupQuadEngine:
     def enqueue(self, quadrant: str, item: dict, lane_hint: int|None=None):
         q = self.quads[quadrant]
         if lane_hint is None:
-            tgt = min(q.lanes, key=lambda L: len(L.queue))
+            idx = min(range(LANES_PER_QUAD), key=q.lane_lens.__getitem__)
         else:
-            tgt = q.lanes[lane_hint % LANES_PER_QUAD]
-        tgt.queue.append(item)
+            idx = lane_hint % LANES_PER_QUAD
+        q.lane_lens[idx] += 1
+        q.lanes[idx].queue.append((float(item.get("weight", 1.0)), item))
 
     def snapshot_load(self) -> Dict[str,int]:
-        return {q: sum(len(L.queue) for L in self.quads[q].lanes) for q in QUADRANTS}
+        return {q: sum(self.quads[q].lane_lens) for q in QUADRANTS}
 
     def step(self, raw_mass: float) -> Dict:
         self.tick += 1
         # refresh mass shares
-        weights = self._weights()
+        weights = self._weights_cache
         for name,w in zip(QUADRANTS,weights):
             self.quads[name].mass_share = w
         # rotation
         self.angle = (self.angle + CAP_ROTATE_DEGREES*(TICK_MULTIPLE)) % 360
-        gate = 0.5*(1+math.cos(math.radians(self.angle)))
+        c, s = self._cos_a, self._sin_a
+        self._cos_a = c*self._dcos - s*self._dsin
+        self._sin_a = s*self._dcos + c*self._dsin
+        if self.tick % 1024 == 0:
+            rad = math.radians(self.angle)
+            self._cos_a, self._sin_a = math.cos(rad), math.sin(rad)
+        gate = 0.5*(1+self._cos_a)
         rot_mod = max(0.05, gate*(1.0-(TICK_MULTIPLE*0.5)))
 
         quad_caps = {}
@@ -85,17 +121,17 @@ class OctupQuadEngine:
             cap = quad_caps[q]
             qd = self.quads[q]
             pulled = 0.0
-            lane_indices = list(range(LANES_PER_QUAD))
+            # modular round-robin; no rotated index-list copy per tick
             start = qd.rr_idx % LANES_PER_QUAD
-            lane_indices = lane_indices[start:] + lane_indices[:start]
-            for idx in lane_indices:
+            for offset in range(LANES_PER_QUAD):
+                idx = (start + offset) & 7  # LANES_PER_QUAD == 8
                 if pulled >= cap: break
                 L = qd.lanes[idx]
                 if not L.queue: continue
-                item = L.queue[0]
-                w = float(item.get("weight",1.0))
+                w = L.queue[0][0]
                 if pulled + w <= cap:
-                    schedule.append((q,L.id,L.queue.popleft()))
+                    schedule.append((q,L.id,L.queue.popleft()[1]))
+                    qd.lane_lens[idx] -= 1
                     pulled += w
             qd.rr_idx = (start+1)%LANES_PER_QUAD
 
@@ -107,8 +143,10 @@ class OctupQuadEngine:
             "scheduled": [(q,lid,it["id"]) for (q,lid,it) in schedule],
             "backlog": self.snapshot_load()
         }
-        # 🔑 Seal it
-        result["seal"] = quma_seal(result)
+        # 🔑 Seal it (clone the pre-salted hasher, hash the tick bytes)
+        h = self._seal_hasher.copy()
+        h.update(_encode_tick(result))
+        result["seal"] = h.hexdigest().translate(_QUMA_TRANS)
         return result
 
 # --- Demo run ---
@@ -2,18 +2,64 @@
 import math, numpy as np
 from typing import List, Tuple, Literal, Dict
 
+try:
+    from numba import njit
+except ImportError:          # numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+try:
+    import numexpr as ne     # optional; fuses the entropy kernel
+except ImportError:
+    ne = None
+
+@njit(cache=True)
+def _stats(a):
+    """Sum, standard deviation, min and max of a float64 array in one
+    streaming pass instead of four separate reductions."""
+    s = 0.0
+    s2 = 0.0
+    amin = a[0]
+    amax = a[0]
+    for v in a:
+        s += v
+        s2 += v * v
+        if v < amin:
+            amin = v
+        if v > amax:
+            amax = v
+    n = a.size
+    m = s / n
+    var = s2 / n - m * m
+    if var < 0.0:        # guard tiny negative rounding residue
+        var = 0.0
+    return s, math.sqrt(var), amin, amax
+
 def efficacy_check_from_values(values: List[float]) -> Dict[str, float]:
-    arr = np.array(values, dtype=float)
+    # asarray: existing float64 arrays pass straight through, so callers
+    # holding an ndarray skip the list round-trip entirely
+    arr = np.asarray(values, dtype=np.float64)
     if len(arr) == 0:
         return {"efficacy_score": 0.0, "balance": 0.0, "entropy": 0.0, "dispersion": 0.0, "force_rating": 0}
 
-    s = arr.sum()
+    s, std, amin, amax = _stats(arr)
     probs = (np.ones_like(arr)/len(arr)) if s == 0 else (arr/s)
 
-    entropy = -np.sum(probs * np.log2(probs + 1e-9))
-    balance = 1.0 / (1.0 + float(arr.std()))
+    # masked log instead of the biased +1e-9 fudge; zero-probability
+    # terms contribute exactly 0. numexpr evaluates the whole kernel in
+    # one streaming pass without the N-sized intermediates.
+    if ne is not None:
+        entropy = -float(ne.evaluate(
+            'sum(where(probs > 0, probs * log(probs), 0.0))')) / math.log(2)
+    else:
+        logs = np.zeros_like(probs)
+        np.log2(probs, where=probs > 0, out=logs)
+        entropy = -np.sum(probs * logs)
+    balance = 1.0 / (1.0 + std)
     entropy_norm = float(entropy / math.log2(len(arr)))
-    dispersion = 1.0 / (1.0 + (float(arr.max()) - float(arr.min())))
+    dispersion = 1.0 / (1.0 + (amax - amin))
     efficacy = (balance + entropy_norm + dispersion) / 3.0
 
     return {
@@ -24,10 +70,37 @@ def efficacy_check_from_values(values: List[float]) -> Dict[str, float]:
         "force_rating": int(round(efficacy * 10000))   # 10k-scale
     }
 
+class DivertMatrix:
+    """Pre-validated row-stochastic diversion matrix.
+
+    Wrapping the matrix once lifts the shape/row-sum checks out of
+    skew_and_check, so repeated calls with fixed geometry pay only for
+    the outflow @ M product.
+    """
+    def __init__(self, matrix):
+        M = np.ascontiguousarray(matrix, dtype=np.float64)
+        if M.ndim != 2 or M.shape[0] != M.shape[1]:
+            raise ValueError("diversion matrix must be square")
+        if not np.allclose(M.sum(axis=1), 1.0, atol=1e-6):
+            raise ValueError("diversion matrix rows must sum to 1")
+        self.M = M
+
+    @property
+    def folds(self) -> int:
+        return self.M.shape[0]
+
+def _ratio_values(ratios: List[Tuple[float, float]]) -> np.ndarray:
+    """n/d per pair with zero-denominator entries mapped to 0.0, done as
+    one masked ufunc divide instead of a Python comprehension."""
+    arr = np.asarray(ratios, dtype=float)
+    if arr.size == 0:
+        return np.empty(0, dtype=float)
+    nums, dens = arr[:, 0], arr[:, 1]
+    return np.divide(nums, dens, out=np.zeros_like(nums), where=(dens != 0.0))
+
 def efficacy_check(ratios: List[Tuple[float, float]]) -> Dict[str, float]:
     # Convenience wrapper for the non-skewed case
-    values = [n/d if d != 0 else 0.0 for n,d in ratios]
-    return efficacy_check_from_values(values)
+    return efficacy_check_from_values(_ratio_values(ratios))
 
 def skew_and_check(
     ratios: List[Tuple[float, float]],
@@ -68,7 +141,7 @@ def skew_and_check(
       - 'diagnostics': efficacy metrics on final values
     """
     # --- 1) Base values
-    base = np.array([ (n/d if d != 0 else 0.0) for (n,d) in ratios ], dtype=float)
+    base = _ratio_values(ratios)
     if len(base) == 0:
         return {"values_raw": [], "values_dilated": [], "values_diverted": [], "diagnostics": efficacy_check_from_values([])}
 
@@ -87,17 +160,24 @@ def skew_and_check(
     else:
         raise ValueError("depth_mode must be one of {'by_fold','by_turn','hybrid'}")
 
-    dil_factors = np.power(dilation, power.astype(float))
+    # exp(power*log d) avoids the generic pow ufunc; for by_fold the
+    # factors collapse to an O(folds) table gathered by fold index
+    if dilation > 0:
+        logd = math.log(dilation)
+        if depth_mode == "by_fold":
+            dil_factors = np.exp(np.arange(folds) * logd)[fold_idx]
+        else:
+            dil_factors = np.exp(power.astype(np.float64) * logd)
+    else:
+        dil_factors = np.power(dilation, power.astype(float))
     dilated = base * dil_factors
 
     # --- 4) Build diversion plan
     # Compute totals per fold to divert; operate at element level preserving fold mapping.
     final = dilated.copy()
     if divert > 0.0:
-        # Aggregate by fold
-        fold_sums = np.zeros(folds, dtype=float)
-        for f in range(folds):
-            fold_sums[f] = float(dilated[fold_idx == f].sum())
+        # Aggregate by fold in one linear pass
+        fold_sums = np.bincount(fold_idx, weights=dilated, minlength=folds)
 
         # Outflow per fold
         outflow = divert * fold_sums
@@ -108,59 +188,60 @@ def skew_and_check(
                 inflow[(f + 1) % folds] += outflow[f]
 
         elif divert_mode == "spread":
-            # Spread to all OTHER folds uniformly
+            # Spread to all OTHER folds uniformly; closed form of the
+            # pairwise shares: each fold receives (total - own)/(folds-1)
             if folds > 1:
-                for f in range(folds):
-                    share = outflow[f] / (folds - 1)
-                    for g in range(folds):
-                        if g != f:
-                            inflow[g] += share
+                inflow = (outflow.sum() - outflow) / (folds - 1)
 
         elif divert_mode == "matrix":
             if matrix is None:
                 raise ValueError("Provide a (folds x folds) stochastic matrix for divert_mode='matrix'.")
-            M = np.array(matrix, dtype=float)
-            if M.shape != (folds, folds):
+            # DivertMatrix instances were validated at construction; raw
+            # arrays are checked here (row-stochastic: each row sums to 1)
+            if not isinstance(matrix, DivertMatrix):
+                matrix = DivertMatrix(matrix)
+            if matrix.folds != folds:
                 raise ValueError(f"matrix must be shape ({folds},{folds})")
-            # Row-stochastic: each row sums to 1 (how a fold distributes its outflow)
-            row_sums = M.sum(axis=1, keepdims=True)
-            if not np.allclose(row_sums, 1.0, atol=1e-6):
-                raise ValueError("diversion matrix rows must sum to 1")
-            inflow = outflow @ M  # shape: (folds,)
+            inflow = outflow @ matrix.M  # shape: (folds,)
 
         else:
             raise ValueError("divert_mode must be 'next', 'spread', or 'matrix'")
 
-        # Apply outflow and inflow back to elements proportionally within each fold
-        # Reduce each element in fold f by the same fraction of its fold outflow
-        final = dilated.copy()
-        for f in range(folds):
-            mask = (fold_idx == f)
-            fold_total = float(dilated[mask].sum())
-            if fold_total > 0:
-                final[mask] *= (1.0 - divert)  # uniform reduction for that fold
-
-        # Distribute inflow into elements of destination folds proportional to their (post-reduction) mass
-        for g in range(folds):
-            mask = (fold_idx == g)
-            seg = final[mask]
-            seg_sum = float(seg.sum())
-            if inflow[g] > 0 and seg_sum > 0:
-                final[mask] += (seg / seg_sum) * inflow[g]
-            elif inflow[g] > 0 and seg_sum == 0:
-                # if destination fold is empty (edge case), distribute evenly across its members
-                count = int(mask.sum())
-                if count > 0:
-                    final[mask] += inflow[g] / count
-
-        # Optional global renormalization to preserve total sum of the dilated vector
+        # Apply outflow and inflow back to elements proportionally within
+        # each fold, gathered through per-fold factor arrays instead of
+        # one masked pass per fold
+        shrink = np.where(fold_sums > 0, 1.0 - divert, 1.0)
+        final = dilated * shrink[fold_idx]
+
+        # Distribute inflow into destination folds proportional to their
+        # (post-reduction) mass; empty-mass folds get an even split
+        seg_sums = np.bincount(fold_idx, weights=final, minlength=folds)
+        counts = np.bincount(fold_idx, minlength=folds)
+        gain = np.where((inflow > 0) & (seg_sums > 0),
+                        inflow / np.where(seg_sums != 0, seg_sums, 1.0), 0.0)
+        final += final * gain[fold_idx]
+        even = np.where((inflow > 0) & (seg_sums == 0) & (counts > 0),
+                        inflow / np.maximum(counts, 1), 0.0)
+        final += even[fold_idx]
+
+        # Optional global renormalization to preserve total sum of the
+        # dilated vector. All three modes are mass-conserving in
+        # aggregate, so the ratio is provably 1 unless some inflow had
+        # no destination (empty target fold) or a fold held negative
+        # mass (shrink skips it while its outflow still propagates);
+        # only then are the two reductions and the rescale needed.
         if preserve_sum:
-            target_sum = float(dilated.sum())
-            cur_sum = float(final.sum())
-            if cur_sum > 0:
-                final *= (target_sum / cur_sum)
+            landed = (seg_sums > 0) | ((seg_sums == 0) & (counts > 0))
+            conserving = not (np.any(fold_sums < 0)
+                              or np.any(inflow < 0)
+                              or np.any((inflow > 0) & ~landed))
+            if not conserving:
+                target_sum = float(dilated.sum())
+                cur_sum = float(final.sum())
+                if cur_sum > 0:
+                    final *= (target_sum / cur_sum)
 
-    diagnostics = efficacy_check_from_values(final.tolist())
+    diagnostics = efficacy_check_from_values(final)
     return {
         "values_raw": base.tolist(),
         "values_dilated": dilated.tolist(),
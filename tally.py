@@ -1,5 +1,14 @@
 import math
-from statistics import mean, median
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:          # numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
 
 # Constants for your expression:
 C = 1_860_320
@@ -15,11 +24,11 @@ def digits_from_k(k):
     return int(math.floor(lam)) + 1
 
 def epoch_sympathiser(phases):  # ES via circular resultant length
-    if not phases:
+    p = np.asarray(phases, dtype=np.float64)
+    if p.size == 0:
         return 0.0
-    sx = sum(math.cos(2*math.pi*p) for p in phases)
-    sy = sum(math.sin(2*math.pi*p) for p in phases)
-    R = math.hypot(sx, sy) / len(phases)
+    ang = (2 * np.pi) * p
+    R = math.hypot(np.cos(ang).sum(), np.sin(ang).sum()) / p.size
     return R  # in [0,1]
 
 def normalize_series(xs):
@@ -28,47 +37,77 @@ def normalize_series(xs):
         return [0.0 for _ in xs], lo, hi
     return [(x - lo) / (hi - lo) for x in xs], lo, hi
 
+@njit(cache=True)
+def _tally_core(k_flat, offsets, log10c, log10pi):
+    """Per-group digit/phase/resultant accumulators over the flattened
+    epoch in one compiled pass; groups are [offsets[g], offsets[g+1])."""
+    n_t = offsets.shape[0] - 1
+    dsum = np.empty(n_t, dtype=np.float64)
+    psum = np.empty(n_t, dtype=np.float64)
+    sx = np.empty(n_t, dtype=np.float64)
+    sy = np.empty(n_t, dtype=np.float64)
+    for g in range(n_t):
+        cs = 0.0
+        sn = 0.0
+        ds = 0.0
+        ps = 0.0
+        for i in range(offsets[g], offsets[g + 1]):
+            lam = log10c + k_flat[i] * log10pi
+            fl = math.floor(lam)
+            ph = lam - fl
+            cs += math.cos(2 * math.pi * ph)
+            sn += math.sin(2 * math.pi * ph)
+            ds += fl + 1
+            ps += ph
+        dsum[g] = ds
+        psum[g] = ps
+        sx[g] = cs
+        sy[g] = sn
+    return dsum, psum, sx, sy
+
 def tally_epoch(k_groups_per_t, weights=(0.4, 0.4, 0.2)):
     """
     k_groups_per_t: list over time t of groups at that step.
       Each entry is a list of k's (one per unit/formation) at time t.
     Returns summary dict with metScores.
     """
-    eff_list, force_list, es_list = [], [], []
-
-    # Build per-time aggregates
-    for k_group in k_groups_per_t:
-        # per-unit phases & digits
-        phases = [phase_metric_from_k(k) for k in k_group]
-        digits = [digits_from_k(k) for k in k_group]
-
-        # pick a representative per-time D, phi (e.g., mean)
-        D_t = round(mean(digits))
-        phi_t = mean(phases)
-        Eff_t = (D_t, phi_t)  # hold for now
+    # Flatten the epoch into one contiguous array plus group offsets so
+    # the whole inner loop runs in a single compiled pass
+    counts = np.array([len(g) for g in k_groups_per_t], dtype=np.int64)
+    offsets = np.zeros(counts.size + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    k_flat = np.concatenate([np.asarray(g, dtype=np.float64)
+                             for g in k_groups_per_t])
+    dsum, psum, sx, sy = _tally_core(k_flat, offsets, LOG10C, LOG10PI)
 
-        # store aggregates
-        eff_list.append(D_t)
-        force_list.append(10_000 * D_t + int(1_000_000 * phi_t))
-        es_list.append(epoch_sympathiser(phases))
+    # per-time aggregates as int64/float64 arrays; all the summary
+    # reductions below then stay in NumPy C loops
+    cnts = counts.astype(np.float64)
+    D_arr = np.rint(dsum / cnts).astype(np.int64)   # representative per-time D (mean)
+    phi = psum / cnts
+    force_arr = 10_000 * D_arr + (1_000_000.0 * phi).astype(np.int64)
+    es_arr = np.hypot(sx, sy) / cnts
 
     # Normalize efficacy by digits span across epoch
-    D_min, D_max = min(eff_list), max(eff_list)
-    Eff_norm = [(D - D_min) / (D_max - D_min) if D_max > D_min else 0.0 for D in eff_list]
+    D_min, D_max = int(D_arr.min()), int(D_arr.max())
+    Eff_norm = ((D_arr - D_min) / (D_max - D_min) if D_max > D_min
+                else np.zeros(D_arr.size))
 
     # Normalize force to [0,1] for the normalized lens blend
-    Force_norm, F_lo, F_hi = normalize_series(force_list)
+    F_lo, F_hi = force_arr.min(), force_arr.max()
+    Force_norm = ((force_arr - F_lo) / (F_hi - F_lo) if F_hi > F_lo
+                  else np.zeros(force_arr.size))
 
     # Averages for normalized metScore
     wE, wF, wS = weights
-    met_norm = wE * mean(Eff_norm) + wF * mean(Force_norm) + wS * mean(es_list)
+    met_norm = float(wE * Eff_norm.mean() + wF * Force_norm.mean() + wS * es_arr.mean())
 
     # Expanded lens (report raw stats)
     expanded = {
-        "force_mean": mean(force_list),
-        "force_median": median(force_list),
-        "ES_mean": mean(es_list),
-        "ES_median": median(es_list),
+        "force_mean": float(force_arr.mean()),
+        "force_median": float(np.median(force_arr)),
+        "ES_mean": float(es_arr.mean()),
+        "ES_median": float(np.median(es_arr)),
         "D_min": D_min,
         "D_max": D_max
     }
@@ -77,9 +116,9 @@ def tally_epoch(k_groups_per_t, weights=(0.4, 0.4, 0.2)):
         "normalized_metScore": met_norm,
         "expanded": expanded,
         "per_t": {
-            "Eff_norm": Eff_norm,
-            "Force": force_list,
-            "ES": es_list
+            "Eff_norm": Eff_norm.tolist(),
+            "Force": force_arr.tolist(),
+            "ES": es_arr.tolist()
         }
     }
 
@@ -1,5 +1,6 @@
 import math
-from statistics import mean, median
+
+import numpy as np
 
 # ---- constants for your expression E = C * 3^144 * pi^k ----
 C = 1_860_320
@@ -15,10 +16,10 @@ def digits_from_k(k):
     return int(math.floor(lam)) + 1
 
 def epoch_sympathiser(phases):  # circular resultant length
-    if not phases: return 0.0
-    sx = sum(math.cos(2*math.pi*p) for p in phases)
-    sy = sum(math.sin(2*math.pi*p) for p in phases)
-    return math.hypot(sx, sy) / len(phases)
+    p = np.asarray(phases, dtype=np.float64)
+    if p.size == 0: return 0.0
+    ang = (2 * np.pi) * p
+    return math.hypot(np.cos(ang).sum(), np.sin(ang).sum()) / p.size
 
 def normalize_series(xs):
     lo, hi = min(xs), max(xs)
@@ -28,25 +29,37 @@ def normalize_series(xs):
 def tally_epoch(k_groups_per_t, weights=(0.4,0.4,0.2)):
     eff_digits, forces, ES = [], [], []
     for k_group in k_groups_per_t:
-        phases = [phase_metric_from_k(k) for k in k_group]
-        digits = [digits_from_k(k) for k in k_group]
-        D_t = round(mean(digits))
-        phi_t = mean(phases)
+        # vectorized phases & digits sharing one floor pass
+        k_arr = np.asarray(k_group, dtype=np.float64)
+        lam = LOG10C + k_arr * LOG10PI
+        fl = np.floor(lam)
+        phases = lam - fl
+        digits = fl.astype(np.int64) + 1
+        D_t = round(float(digits.mean()))
+        phi_t = float(phases.mean())
         eff_digits.append(D_t)
         forces.append(10_000 * D_t + int(1_000_000 * phi_t))
         ES.append(epoch_sympathiser(phases))
-    D_min, D_max = min(eff_digits), max(eff_digits)
-    Eff_norm = [(D - D_min)/(D_max - D_min) if D_max>D_min else 0.0 for D in eff_digits]
-    Force_norm, _, _ = normalize_series(forces)
+    # summary reductions on int64/float64 arrays instead of the pure
+    # Python statistics helpers
+    eff_arr = np.asarray(eff_digits, dtype=np.int64)
+    force_arr = np.asarray(forces, dtype=np.int64)
+    es_arr = np.asarray(ES, dtype=np.float64)
+    D_min, D_max = int(eff_arr.min()), int(eff_arr.max())
+    Eff_norm = ((eff_arr - D_min)/(D_max - D_min) if D_max > D_min
+                else np.zeros(eff_arr.size))
+    F_lo, F_hi = force_arr.min(), force_arr.max()
+    Force_norm = ((force_arr - F_lo)/(F_hi - F_lo) if F_hi > F_lo
+                  else np.zeros(force_arr.size))
     wE, wF, wS = weights
-    met_norm = wE*mean(Eff_norm) + wF*mean(Force_norm) + wS*mean(ES)
+    met_norm = float(wE*Eff_norm.mean() + wF*Force_norm.mean() + wS*es_arr.mean())
     return {
         "normalized_metScore": met_norm,
         "expanded": {
-            "force_mean": mean(forces),
-            "force_median": median(forces),
-            "ES_mean": mean(ES),
-            "ES_median": median(ES),
+            "force_mean": float(force_arr.mean()),
+            "force_median": float(np.median(force_arr)),
+            "ES_mean": float(es_arr.mean()),
+            "ES_median": float(np.median(es_arr)),
             "D_min": D_min,
             "D_max": D_max
         }
@@ -1,19 +1,25 @@
 import math
-import random
 import time
 import hashlib
 import json
 
+import numpy as np
+
 # ---------- utilities ----------
 def normalize(vec):
     s = sum(abs(v) for v in vec) or 1.0
     return tuple(v / s for v in vec)
 
-# QUMA nonstandard hex serializer (simple deterministic transform + salt)
-QUMA_MAP = {
-    '0':'Q','1':'X','2':'M','3':'H','4':'A','5':'V','6':'E','7':'R','8':'S','9':'O',
-    'a':'L','b':'I','c':'G','d':'T','e':'U','f':'N'
-}
+def _normalize_np(A):
+    """Row-wise L1 normalization of an (N, k) array with safe divide;
+    the batched counterpart of normalize()."""
+    s = np.abs(A).sum(axis=1, keepdims=True)
+    s[s == 0] = 1.0
+    return A / s
+
+# QUMA nonstandard hex serializer (simple deterministic transform + salt);
+# the hex remap is a single C-level translate
+_QUMA_TRANS = str.maketrans('0123456789abcdef', 'QXMHAVERSOLIGTUN')
 def quma_serialize(obj, salt="QUMA"):
     """
     Deterministic quma serialize: JSON -> sha256 -> map hex -> QUMA string.
@@ -21,7 +27,7 @@ def quma_serialize(obj, salt="QUMA"):
     """
     j = json.dumps(obj, sort_keys=True, separators=(',',':'))
     h = hashlib.sha256((j + salt).encode()).hexdigest()
-    return ''.join(QUMA_MAP[ch] for ch in h)
+    return h.translate(_QUMA_TRANS)
 
 # Assume Quadratalizer exists (from earlier) with .quadratalize(x,y,angle,radius,meta)
 # For this snippet, implement a compact version:
@@ -45,9 +51,10 @@ def kerflump_channel(x,y,entropy_scale=0.08, seed=None):
     Produce a kerflumped vector variation.
     If seed provided -> deterministic pseudo-random stream (useful for reproducible duo channels).
     """
-    rnd = random.Random(seed)
-    ex = rnd.gauss(0, entropy_scale)
-    ey = rnd.gauss(0, entropy_scale)
+    # PCG64 state init is a few machine words vs the 2.5 KB Mersenne
+    # Twister table random.Random would rebuild for two draws
+    rng = np.random.Generator(np.random.PCG64(seed))
+    ex, ey = rng.standard_normal(2) * entropy_scale
     xp, yp = x + ex, y + ey
     mag = math.hypot(xp, yp)
     if mag == 0:
@@ -59,6 +66,16 @@ def kerflump_channel(x,y,entropy_scale=0.08, seed=None):
 class DuoQuadratlizer:
     def __init__(self, quadratalizer=None):
         self.q = quadratalizer or SimpleQuadratalizer()
+        # blake2b states with "<base_seed>|" already absorbed; per node
+        # we clone one and feed only the short node/tick suffix
+        self._seed_prefixes = {}
+
+    def _seed_prefix(self, base_seed):
+        h = self._seed_prefixes.get(base_seed)
+        if h is None:
+            h = hashlib.blake2b(f"{base_seed}|".encode(), digest_size=32)
+            self._seed_prefixes[base_seed] = h
+        return h.copy()
 
     def duoquadratlize_node(self, node, base_seed, metronome_tick):
         """
@@ -66,12 +83,14 @@ class DuoQuadratlizer:
         base_seed: large int or string to derive channel seeds
         metronome_tick: the SCOOTY tick time (plank-sec)
         """
-        # derive two deterministic seeds from base seed + node id + tick
-        s1 = hashlib.sha256(f"{base_seed}|{node.id}|{metronome_tick}|A".encode()).hexdigest()
-        s2 = hashlib.sha256(f"{base_seed}|{node.id}|{metronome_tick}|B".encode()).hexdigest()
-        # convert hex -> int seeds
-        seedA = int(s1[:16], 16)
-        seedB = int(s2[:16], 16)
+        # derive both deterministic seeds from one blake2b digest of
+        # base seed + node id + tick; disjoint 8-byte slices keep the
+        # channels independent without a second hash pass
+        hasher = self._seed_prefix(base_seed)
+        hasher.update(f"{node.id}|{metronome_tick}".encode())
+        h = hasher.digest()
+        seedA = int.from_bytes(h[:8], 'big')
+        seedB = int.from_bytes(h[16:24], 'big')
 
         # kerflump into two channels
         vecA = kerflump_channel(node.x, node.y, entropy_scale=0.06, seed=seedA)
@@ -84,7 +103,7 @@ class DuoQuadratlizer:
         # differential analysis
         diffs = {k: quadA[k] - quadB.get(k,0.0) for k in ['Q0','Q1','Q2','Q3']}
         diff_norm = normalize((diffs['Q0'], diffs['Q1'], diffs['Q2'], diffs['Q3']))
-        anomaly_score = sum(abs(v) for v in diffs)  # simple L1 anomaly
+        anomaly_score = sum(abs(v) for v in diffs.values())  # simple L1 anomaly
 
         # seal both outputs using QUMA serializer
         meta_blob = {
@@ -111,6 +130,81 @@ class DuoQuadratlizer:
         }
         return record
 
+    def duoquadratlize_batch(self, nodes, base_seed, metronome_tick):
+        """
+        SoA batch variant of duoquadratlize_node: kerflump noise,
+        energies and quadrant scores for the whole batch are computed
+        as NumPy arrays; only the per-node sealing stays scalar.
+        Channel noise comes from one vectorized PCG64 stream per
+        channel, so values differ from per-node duoquadratlize_node
+        draws but stay deterministic in (base_seed, tick).
+        """
+        n = len(nodes)
+        if n == 0:
+            return []
+        xs = np.array([nd.x for nd in nodes], dtype=np.float64)
+        ys = np.array([nd.y for nd in nodes], dtype=np.float64)
+        angles = np.array([nd.angle for nd in nodes], dtype=np.float64)
+        radii = np.array([nd.radius for nd in nodes], dtype=np.float64)
+
+        # one digest seeds both channel streams (disjoint 8-byte slices)
+        hasher = self._seed_prefix(base_seed)
+        hasher.update(f"{metronome_tick}".encode())
+        h = hasher.digest()
+        rows = np.arange(n)
+        idx = (np.floor((angles % 360.0) / 90.0).astype(np.int32)) % 4
+        channels = []
+        for off, scale in ((0, 0.06), (16, 0.12)):
+            rng = np.random.Generator(
+                np.random.PCG64(int.from_bytes(h[off:off + 8], 'big')))
+            ex, ey = rng.normal(0.0, scale, size=(2, n))
+            xp, yp = xs + ex, ys + ey
+            mag = np.hypot(xp, yp)
+            compact = np.log1p(mag)
+            safe = np.where(mag == 0.0, 1.0, mag)
+            vx = np.where(mag == 0.0, 0.0, xp / safe * compact)
+            vy = np.where(mag == 0.0, 0.0, yp / safe * compact)
+            energy = np.hypot(vx, vy) + radii * 0.5
+            scores = np.zeros((n, 4))
+            scores[rows, idx] = energy
+            scores[rows, (idx + 1) % 4] += 0.3 * energy
+            scores[rows, (idx - 1) % 4] += 0.15 * energy
+            totals = scores.sum(axis=1, keepdims=True)
+            scores /= np.where(totals == 0.0, 1.0, totals)
+            channels.append((scores, energy))
+
+        (scoresA, energyA), (scoresB, energyB) = channels
+        diffs = scoresA - scoresB
+        anomalies = np.abs(diffs).sum(axis=1)
+        diff_norms = _normalize_np(diffs)
+
+        records = []
+        for i, node in enumerate(nodes):
+            quadA = {f'Q{j}': float(scoresA[i, j]) for j in range(4)}
+            quadA['meta'] = {'sector': int(idx[i]), 'raw_energy': float(energyA[i])}
+            quadB = {f'Q{j}': float(scoresB[i, j]) for j in range(4)}
+            quadB['meta'] = {'sector': int(idx[i]), 'raw_energy': float(energyB[i])}
+            anomaly_score = float(anomalies[i])
+            meta_blob = {
+                'node_id': node.id,
+                'tick': metronome_tick,
+                'angle': node.angle,
+                'radius': node.radius,
+                'anomaly': anomaly_score
+            }
+            records.append({
+                'node': node.id,
+                'tick': metronome_tick,
+                'quadA': quadA,
+                'quadB': quadB,
+                'diff_normalized': tuple(float(d) for d in diff_norms[i]),
+                'anomaly_score': anomaly_score,
+                'sealed_blob_A': quma_serialize({'quad': quadA, 'meta': meta_blob}, salt="QUMA-A"),
+                'sealed_blob_B': quma_serialize({'quad': quadB, 'meta': meta_blob}, salt="QUMA-B"),
+                'scooty_stamp': f"SCOOTY::{metronome_tick}"
+            })
+        return records
+
 # ---------- Example usage ----------
 # Suppose 'node' follows the Node namedtuple shape from earlier:
 from collections import namedtuple